@@ -1,17 +1,104 @@
+import asyncio
+import numbers
+import time
+from bisect import bisect_left, bisect_right
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Executor, ProcessPoolExecutor, ThreadPoolExecutor, wait
+from typing import AsyncIterable, AsyncIterator, Iterable, Iterator, List, Optional, Sequence, Union
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+MOOD_LABELS = ("неуд", "норм", "отл")
+
+
 class SomeModel:
     def predict(self, message: str) -> float:
         pass
 
 
-def predict_message_mood(message: str, model: SomeModel, bad_threshold: float = 0.3,
-                         good_threshold: float = 0.8) -> str:
+class PredictionCache:
+    def __init__(self, limit: int = 1024, ttl: Optional[float] = None) -> None:
+        if not isinstance(limit, int):
+            raise TypeError("Размер кэша должен быть типа int")
+
+        if limit <= 0:
+            raise ValueError("Размер кэша должен быть положительным")
+
+        if ttl is not None:
+            if not isinstance(ttl, (int, float)):
+                raise TypeError("ttl должен быть числом")
+
+            if ttl <= 0:
+                raise ValueError("ttl должен быть положительным")
+
+        self.limit = limit
+        self.ttl = ttl
+        self.hits = 0
+        self.misses = 0
+        self.cache = {}
+
+    @staticmethod
+    def normalize(message: str) -> str:
+        return " ".join(message.lower().split())
+
+    def predict(self, message: str, model: SomeModel) -> float:
+        # Thresholds are not part of the key: one cached score serves any threshold pair.
+        key = (id(model), self.normalize(message))
+        entry = self.cache.get(key)
+
+        if entry is not None:
+            cached_model, prediction, expires_at = entry
+            if cached_model is model and (expires_at is None or time.monotonic() < expires_at):
+                self.hits += 1
+                self._move_to_end(key)
+                return prediction
+
+            del self.cache[key]
+
+        self.misses += 1
+        prediction = model.predict(message)
+
+        expires_at = None if self.ttl is None else time.monotonic() + self.ttl
+        self.cache[key] = (model, prediction, expires_at)
+        if len(self.cache) > self.limit:
+            removed_key = next(iter(self.cache))
+            del self.cache[removed_key]
+
+        return prediction
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self) -> int:
+        return len(self.cache)
+
+    def _move_to_end(self, key) -> None:
+        elem = self.cache.pop(key)
+        self.cache[key] = elem
+
+
+def _check_thresholds(bad_threshold: float, good_threshold: float) -> None:
     if (not isinstance(bad_threshold, float)) or (not isinstance(good_threshold, float)):
         raise TypeError
 
     if bad_threshold > good_threshold:
         raise ValueError("bad_threshold не может быть больше good_threshold")
 
-    prediction = model.predict(message)
+
+def predict_message_mood(message: str, model: SomeModel, bad_threshold: float = 0.3,
+                         good_threshold: float = 0.8, cache: Optional[PredictionCache] = None) -> str:
+    _check_thresholds(bad_threshold, good_threshold)
+
+    if cache is None:
+        prediction = model.predict(message)
+    else:
+        prediction = cache.predict(message, model)
 
     if prediction < bad_threshold:
         return "неуд"
@@ -19,3 +106,173 @@ def predict_message_mood(message: str, model: SomeModel, bad_threshold: float =
         return "отл"
     else:
         return "норм"
+
+
+def _predict_batch(messages: List[str], model: SomeModel) -> Sequence[float]:
+    predict_batch = getattr(model, "predict_batch", None)
+    if callable(predict_batch):
+        predictions = predict_batch(messages)
+
+        # Vectorized models usually return an ndarray (often float32): it is passed on as is.
+        if np is not None and isinstance(predictions, np.ndarray):
+            if predictions.ndim != 1 or predictions.dtype.kind not in "biuf":
+                raise TypeError
+
+            if len(predictions) != len(messages):
+                raise ValueError("predict_batch должен вернуть по одной оценке на сообщение")
+
+            return predictions
+
+        predictions = list(predictions)
+        if len(predictions) != len(messages):
+            raise ValueError("predict_batch должен вернуть по одной оценке на сообщение")
+    else:
+        predictions = [model.predict(message) for message in messages]
+
+    if not all(isinstance(elem, numbers.Real) for elem in predictions):
+        raise TypeError
+
+    return predictions
+
+
+def _label_indices(predictions: Sequence[float], bad_threshold: float, good_threshold: float) -> List[int]:
+    # A score gets one point for reaching bad_threshold and one more for exceeding
+    # good_threshold, which reproduces the strict/non-strict bounds of predict_message_mood.
+    # NaN fails both comparisons there, so it is always labelled "норм".
+    if np is not None:
+        # Thresholds are compared in the precision of the scores, as NumPy does for a single
+        # float32 score compared with a Python float.
+        scores = np.asarray(predictions)
+        if scores.dtype.kind != "f":
+            scores = scores.astype(float)
+        thresholds = np.array([bad_threshold, good_threshold], dtype=scores.dtype)
+        indices = np.searchsorted(thresholds[:1], scores, side="right") + \
+            np.searchsorted(thresholds[1:], scores, side="left")
+        indices[np.isnan(scores)] = 1
+        return indices.tolist()
+
+    return [bisect_right((bad_threshold,), elem) + bisect_left((good_threshold,), elem) for elem in predictions]
+
+
+def predict_messages_mood(messages: Iterable[str], model: SomeModel, bad_threshold: float = 0.3,
+                          good_threshold: float = 0.8) -> List[str]:
+    _check_thresholds(bad_threshold, good_threshold)
+
+    messages = list(messages)
+    if not messages:
+        return []
+
+    predictions = _predict_batch(messages, model)
+
+    return [MOOD_LABELS[index] for index in _label_indices(predictions, bad_threshold, good_threshold)]
+
+
+def _make_executor(backend: str, max_workers: Optional[int]) -> Executor:
+    if backend == "thread":
+        return ThreadPoolExecutor(max_workers=max_workers)
+    elif backend == "process":
+        return ProcessPoolExecutor(max_workers=max_workers)
+    else:
+        raise ValueError("backend должен быть 'thread' или 'process'")
+
+
+def _check_window(max_in_flight: Optional[int], max_workers: Optional[int]) -> int:
+    if max_in_flight is None:
+        return 2 * (max_workers or 4)
+
+    if not isinstance(max_in_flight, int):
+        raise TypeError
+
+    if max_in_flight <= 0:
+        raise ValueError("max_in_flight должен быть положительным")
+
+    return max_in_flight
+
+
+def score_messages(messages: Iterable[str], model: SomeModel, bad_threshold: float = 0.3,
+                   good_threshold: float = 0.8, backend: str = "thread", max_workers: Optional[int] = None,
+                   max_in_flight: Optional[int] = None, ordered: bool = True) -> Iterator[str]:
+    _check_thresholds(bad_threshold, good_threshold)
+    window = _check_window(max_in_flight, max_workers)
+
+    with _make_executor(backend, max_workers) as executor:
+        pending = deque() if ordered else set()
+
+        for message in messages:
+            if len(pending) >= window:
+                if ordered:
+                    yield pending.popleft().result()
+                else:
+                    done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            future = executor.submit(predict_message_mood, message, model, bad_threshold, good_threshold)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+
+        while pending:
+            if ordered:
+                yield pending.popleft().result()
+            else:
+                done, pending = wait(pending, return_when=FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+
+async def _aiterate(messages: Union[Iterable[str], AsyncIterable[str]]) -> AsyncIterator[str]:
+    if hasattr(messages, "__aiter__"):
+        async for message in messages:
+            yield message
+    else:
+        for message in messages:
+            yield message
+
+
+async def ascore_messages(messages: Union[Iterable[str], AsyncIterable[str]], model: SomeModel,
+                          bad_threshold: float = 0.3, good_threshold: float = 0.8, backend: str = "thread",
+                          max_workers: Optional[int] = None, max_in_flight: Optional[int] = None,
+                          ordered: bool = True) -> AsyncIterator[str]:
+    _check_thresholds(bad_threshold, good_threshold)
+    window = _check_window(max_in_flight, max_workers)
+    loop = asyncio.get_running_loop()
+
+    executor = _make_executor(backend, max_workers)
+    pending = deque() if ordered else set()
+    finished = False
+    try:
+        async for message in _aiterate(messages):
+            if len(pending) >= window:
+                if ordered:
+                    yield await pending.popleft()
+                else:
+                    done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                    for future in done:
+                        yield future.result()
+
+            future = loop.run_in_executor(executor, predict_message_mood, message, model,
+                                          bad_threshold, good_threshold)
+            if ordered:
+                pending.append(future)
+            else:
+                pending.add(future)
+
+        while pending:
+            if ordered:
+                yield await pending.popleft()
+            else:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    yield future.result()
+
+        finished = True
+    finally:
+        # The generator may be closed early on the event loop thread, where waiting for running
+        # predictions would block it: queued ones are cancelled and the rest is left to finish.
+        if not finished:
+            for future in pending:
+                future.cancel()
+
+        executor.shutdown(wait=finished, cancel_futures=not finished)
@@ -1,5 +1,9 @@
+import asyncio
+import time
 import unittest
-from evaluation_message import SomeModel, predict_message_mood
+import evaluation_message
+from evaluation_message import SomeModel, PredictionCache, predict_message_mood, predict_messages_mood, \
+    score_messages, ascore_messages
 from unittest import mock
 
 
@@ -129,5 +133,309 @@ class TestPredictMessageMood(unittest.TestCase):
             predict_message_mood("This is a message", SomeModel(), good_threshold="good")
 
 
+class BatchModel(SomeModel):
+    def predict_batch(self, messages):
+        pass
+
+
+class TestPredictMessagesMood(unittest.TestCase):
+    def setUp(self):
+        self.model = SomeModel()
+        self.messages = ["message 1", "message 2", "message 3", "message 4", "message 5"]
+        self.predictions = [0.1, 0.3, 0.5, 0.8, 0.9]
+        self.expected = ["неуд", "норм", "норм", "норм", "отл"]
+
+    def test_predict_messages_mood_fallback_to_predict(self):
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.side_effect = self.predictions
+            result = predict_messages_mood(self.messages, self.model)
+            self.assertEqual(result, self.expected)
+            self.assertEqual([mock.call(message) for message in self.messages], func.mock_calls)
+
+    def test_predict_messages_mood_uses_predict_batch(self):
+        model = BatchModel()
+        with mock.patch.object(BatchModel, 'predict_batch') as batch_func, \
+                mock.patch.object(BatchModel, 'predict') as func:
+            batch_func.return_value = self.predictions
+            result = predict_messages_mood(iter(self.messages), model)
+            self.assertEqual(result, self.expected)
+            self.assertEqual([mock.call(self.messages)], batch_func.mock_calls)
+            self.assertEqual(func.call_count, 0)
+
+    def test_predict_messages_mood_without_numpy(self):
+        with mock.patch.object(SomeModel, 'predict') as func, mock.patch.object(evaluation_message, 'np', None):
+            func.side_effect = self.predictions
+            result = predict_messages_mood(self.messages, self.model)
+            self.assertEqual(result, self.expected)
+
+    def test_predict_messages_mood_matches_single_predictions(self):
+        predictions = [0.0, 0.49, 0.5, 0.51, 1.0, -3.0, 7.0, float('nan')]
+        for bad_threshold, good_threshold in [(0.5, 0.5), (0.3, 0.8), (0.0, 1.0)]:
+            with mock.patch.object(SomeModel, 'predict') as func:
+                func.side_effect = predictions
+                result = predict_messages_mood(["m"] * len(predictions), self.model, bad_threshold, good_threshold)
+
+            with mock.patch.object(SomeModel, 'predict') as func, mock.patch.object(evaluation_message, 'np', None):
+                func.side_effect = predictions
+                self.assertEqual(predict_messages_mood(["m"] * len(predictions), self.model, bad_threshold,
+                                                       good_threshold), result)
+
+            expected = []
+            for prediction in predictions:
+                with mock.patch.object(SomeModel, 'predict') as func:
+                    func.return_value = prediction
+                    expected.append(predict_message_mood("m", self.model, bad_threshold, good_threshold))
+
+            self.assertEqual(result, expected)
+
+    def test_predict_messages_mood_empty(self):
+        with mock.patch.object(SomeModel, 'predict') as func:
+            self.assertEqual(predict_messages_mood([], self.model), [])
+            self.assertEqual(func.call_count, 0)
+
+    def test_predict_messages_mood_thresholds_checked_once(self):
+        with mock.patch.object(SomeModel, 'predict') as func:
+            with self.assertRaises(ValueError) as err:
+                predict_messages_mood(self.messages, self.model, bad_threshold=0.9, good_threshold=0.2)
+
+            self.assertEqual(str(err.exception), "bad_threshold не может быть больше good_threshold")
+            self.assertEqual(func.call_count, 0)
+
+            with self.assertRaises(TypeError):
+                predict_messages_mood(self.messages, self.model, bad_threshold="bad")
+
+    def test_predict_messages_mood_predict_return_not_number(self):
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = "jfdshfdjgf"
+            with self.assertRaises(TypeError):
+                predict_messages_mood(self.messages, self.model)
+
+    def test_predict_messages_mood_predict_batch_ndarray(self):
+        if evaluation_message.np is None:
+            self.skipTest('numpy is not installed')
+
+        np = evaluation_message.np
+        predictions = np.array(self.predictions, dtype=np.float32)
+        expected = []
+        for prediction in predictions:
+            with mock.patch.object(SomeModel, 'predict') as func:
+                func.return_value = prediction
+                expected.append(predict_message_mood("m", self.model))
+
+        with mock.patch.object(BatchModel, 'predict_batch') as batch_func:
+            batch_func.return_value = predictions
+            self.assertEqual(predict_messages_mood(self.messages, BatchModel()), expected)
+
+            batch_func.return_value = list(predictions)
+            self.assertEqual(predict_messages_mood(self.messages, BatchModel()), expected)
+
+            batch_func.return_value = np.array([0, 1, 0, 1, 1], dtype=np.int64)
+            self.assertEqual(predict_messages_mood(self.messages, BatchModel()), ["неуд", "отл", "неуд", "отл", "отл"])
+
+            batch_func.return_value = np.array(["0.5"] * 5)
+            with self.assertRaises(TypeError):
+                predict_messages_mood(self.messages, BatchModel())
+
+            batch_func.return_value = np.zeros((5, 1))
+            with self.assertRaises(TypeError):
+                predict_messages_mood(self.messages, BatchModel())
+
+            batch_func.return_value = np.zeros(4, dtype=np.float32)
+            with self.assertRaises(ValueError):
+                predict_messages_mood(self.messages, BatchModel())
+
+    def test_predict_messages_mood_predict_batch_wrong_length(self):
+        with mock.patch.object(BatchModel, 'predict_batch') as batch_func:
+            batch_func.return_value = [0.5]
+            with self.assertRaises(ValueError):
+                predict_messages_mood(self.messages, BatchModel())
+
+
+class TestPredictionCache(unittest.TestCase):
+    def setUp(self):
+        self.model = SomeModel()
+
+    def test_cache_hits_and_misses(self):
+        cache = PredictionCache(limit=10)
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = 0.1
+            self.assertEqual(predict_message_mood("ok", self.model, cache=cache), "неуд")
+            self.assertEqual(predict_message_mood("  OK ", self.model, cache=cache), "неуд")
+            self.assertEqual(predict_message_mood("thanks", self.model, cache=cache), "неуд")
+
+            self.assertEqual([mock.call("ok"), mock.call("thanks")], func.mock_calls)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+            self.assertEqual(len(cache), 2)
+
+    def test_cache_ignores_thresholds(self):
+        cache = PredictionCache()
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = 0.5
+            self.assertEqual(predict_message_mood("ok", self.model, cache=cache), "норм")
+            self.assertEqual(predict_message_mood("ok", self.model, 0.6, 0.9, cache=cache), "неуд")
+            self.assertEqual(predict_message_mood("ok", self.model, 0.1, 0.2, cache=cache), "отл")
+            self.assertEqual(func.call_count, 1)
+
+    def test_cache_separates_models(self):
+        cache = PredictionCache()
+        other_model = SomeModel()
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = 0.5
+            predict_message_mood("ok", self.model, cache=cache)
+            predict_message_mood("ok", other_model, cache=cache)
+            self.assertEqual(func.call_count, 2)
+            self.assertEqual(cache.misses, 2)
+
+    def test_cache_lru_eviction(self):
+        cache = PredictionCache(limit=2)
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = 0.5
+            predict_message_mood("a", self.model, cache=cache)
+            predict_message_mood("b", self.model, cache=cache)
+            predict_message_mood("a", self.model, cache=cache)
+            predict_message_mood("c", self.model, cache=cache)
+            self.assertEqual(func.call_count, 3)
+
+            predict_message_mood("a", self.model, cache=cache)
+            self.assertEqual(func.call_count, 3)
+
+            predict_message_mood("b", self.model, cache=cache)
+            self.assertEqual(func.call_count, 4)
+            self.assertEqual(len(cache), 2)
+
+    def test_cache_ttl(self):
+        cache = PredictionCache(ttl=10)
+        with mock.patch.object(SomeModel, 'predict') as func, \
+                mock.patch('evaluation_message.time.monotonic') as clock:
+            func.return_value = 0.5
+            clock.return_value = 100.0
+            predict_message_mood("ok", self.model, cache=cache)
+
+            clock.return_value = 109.0
+            predict_message_mood("ok", self.model, cache=cache)
+            self.assertEqual(func.call_count, 1)
+
+            clock.return_value = 110.0
+            predict_message_mood("ok", self.model, cache=cache)
+            self.assertEqual(func.call_count, 2)
+            self.assertEqual((cache.hits, cache.misses), (1, 2))
+
+    def test_cache_clear(self):
+        cache = PredictionCache()
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = 0.5
+            predict_message_mood("ok", self.model, cache=cache)
+            cache.clear()
+            self.assertEqual((len(cache), cache.hits, cache.misses), (0, 0, 0))
+
+    def test_cache_invalid_parameters(self):
+        with self.assertRaises(TypeError):
+            PredictionCache(limit="10")
+
+        with self.assertRaises(ValueError):
+            PredictionCache(limit=0)
+
+        with self.assertRaises(TypeError):
+            PredictionCache(ttl="10")
+
+        with self.assertRaises(ValueError):
+            PredictionCache(ttl=-1)
+
+
+class LengthModel(SomeModel):
+    def predict(self, message):
+        time.sleep(0.001 * (len(message) % 3))
+        return len(message) / 10
+
+
+class TestScoreMessages(unittest.TestCase):
+    def setUp(self):
+        self.model = LengthModel()
+        self.messages = ["a" * length for length in range(12)]
+        self.expected = [predict_message_mood(message, self.model) for message in self.messages]
+
+    def test_score_messages_thread_ordered(self):
+        result = list(score_messages(self.messages, self.model, max_workers=4, max_in_flight=3))
+        self.assertEqual(result, self.expected)
+
+    def test_score_messages_process_ordered(self):
+        result = list(score_messages(self.messages, self.model, backend="process", max_workers=2))
+        self.assertEqual(result, self.expected)
+
+    def test_score_messages_unordered(self):
+        result = list(score_messages(self.messages, self.model, max_workers=4, ordered=False))
+        self.assertEqual(sorted(result), sorted(self.expected))
+
+    def test_score_messages_backpressure(self):
+        pulled = []
+
+        def messages():
+            for message in self.messages:
+                pulled.append(message)
+                yield message
+
+        result = score_messages(messages(), self.model, max_workers=2, max_in_flight=2)
+        next(result)
+        self.assertLessEqual(len(pulled), 3)
+        result.close()
+
+    def test_score_messages_uses_predict(self):
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.return_value = 0.9
+            result = list(score_messages(["m1", "m2"], SomeModel()))
+            self.assertEqual(result, ["отл", "отл"])
+            self.assertEqual(sorted(func.mock_calls), [mock.call("m1"), mock.call("m2")])
+
+    def test_score_messages_invalid_parameters(self):
+        with self.assertRaises(ValueError):
+            list(score_messages(self.messages, self.model, backend="fiber"))
+
+        with self.assertRaises(ValueError):
+            list(score_messages(self.messages, self.model, max_in_flight=0))
+
+        with self.assertRaises(ValueError):
+            list(score_messages(self.messages, self.model, bad_threshold=0.9, good_threshold=0.2))
+
+    def test_score_messages_predict_exception(self):
+        with mock.patch.object(SomeModel, 'predict') as func:
+            func.side_effect = Exception
+            with self.assertRaises(Exception):
+                list(score_messages(["m1"], SomeModel()))
+
+    def test_ascore_messages_iterable(self):
+        async def collect():
+            return [label async for label in ascore_messages(self.messages, self.model, max_in_flight=3)]
+
+        self.assertEqual(asyncio.run(collect()), self.expected)
+
+    def test_ascore_messages_async_iterable_unordered(self):
+        async def messages():
+            for message in self.messages:
+                await asyncio.sleep(0)
+                yield message
+
+        async def collect():
+            return [label async for label in ascore_messages(messages(), self.model, ordered=False)]
+
+        self.assertEqual(sorted(asyncio.run(collect())), sorted(self.expected))
+
+    def test_ascore_messages_aclose_does_not_block(self):
+        class SlowModel(SomeModel):
+            def predict(self, message):
+                time.sleep(0.05 if message == "first" else 1)
+                return 0.5
+
+        async def first_label():
+            labels = ascore_messages(["first", "m1", "m2", "m3"], SlowModel(), max_workers=2)
+            label = await labels.__anext__()
+            start = time.perf_counter()
+            await labels.aclose()
+            return label, time.perf_counter() - start
+
+        label, close_time = asyncio.run(first_label())
+        self.assertEqual(label, "норм")
+        self.assertLess(close_time, 0.5)
+
+
 if __name__ == "__main__":
     unittest.main()
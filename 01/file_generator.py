@@ -1,14 +1,28 @@
-from typing import List, Iterator, TextIO, Union
-from io import TextIOBase
+import asyncio
+import mmap
+import os
+import re
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, ProcessPoolExecutor, wait
+from typing import List, AsyncIterator, Iterable, Iterator, TextIO, BinaryIO, Tuple, Optional, Pattern, FrozenSet, Union
+from io import TextIOBase, BufferedIOBase, RawIOBase
 
 
-def search_lines(file: Union[TextIO, str], words: List[str]) -> Iterator[str]:
+_NON_ASCII_BYTE = re.compile(rb'[\x80-\xff]')
+
+
+def _check_words(words: List[str]) -> None:
     if not isinstance(words, list):
         raise TypeError
     else:
         if not all(isinstance(elem, str) for elem in words):
             raise TypeError
 
+
+def search_lines(file: Union[TextIO, str], words: List[str]) -> Iterator[str]:
+    _check_words(words)
+
     if not isinstance(file, TextIOBase) and not isinstance(file, str):
         raise TypeError
 
@@ -17,11 +31,403 @@ def search_lines(file: Union[TextIO, str], words: List[str]) -> Iterator[str]:
     else:
         f = file
 
+    keywords = frozenset(word.lower() for word in words)
+
     for line in f:
-        for word in words:
-            if word.lower() in line.lower().split():
-                yield line.rstrip('\n')
-                break
+        if not keywords.isdisjoint(line.lower().split()):
+            yield line.rstrip('\n')
 
     if isinstance(file, str):
         f.close()
+
+
+def _compile_keywords(words: List[str], encoding: str) -> Tuple[FrozenSet[str], Optional[Pattern[bytes]]]:
+    keywords = frozenset(word.lower() for word in words)
+
+    # Only ASCII keywords can occur in ASCII-only lines, and for those bytes.lower()
+    # agrees with str.lower(), so a byte-level substring search is a safe prefilter.
+    ascii_keywords = sorted((word.encode(encoding) for word in keywords if word.isascii() and word),
+                            key=len, reverse=True)
+    pattern = re.compile(b'|'.join(map(re.escape, ascii_keywords))) if ascii_keywords else None
+
+    return keywords, pattern
+
+
+def _normalize_newlines(chunk: bytes) -> bytes:
+    # Text mode reads files with universal newlines, where \r\n and a lone \r end lines too.
+    # The scanners only split on \n, so chunks containing \r are translated the same way first.
+    if b'\r' not in chunk:
+        return chunk
+
+    return chunk.replace(b'\r\n', b'\n').replace(b'\r', b'\n')
+
+
+def _candidate_line_starts(chunk: bytes, pattern: Optional[Pattern[bytes]]) -> List[int]:
+    starts = set()
+
+    searches = [] if pattern is None else [(pattern, chunk.lower())]
+    if not chunk.isascii():
+        searches.append((_NON_ASCII_BYTE, chunk))
+
+    for regex, data in searches:
+        match = regex.search(data)
+        while match is not None:
+            start = data.rfind(b'\n', 0, match.start()) + 1
+            starts.add(start)
+
+            end = data.find(b'\n', match.end())
+            if end == -1:
+                break
+            match = regex.search(data, end + 1)
+
+    return sorted(starts)
+
+
+def _scan_chunk(chunk: bytes, keywords: FrozenSet[str], pattern: Optional[Pattern[bytes]],
+                encoding: str) -> Iterator[Tuple[int, str]]:
+    for start in _candidate_line_starts(chunk, pattern):
+        end = chunk.find(b'\n', start)
+        if end == -1:
+            end = len(chunk)
+
+        line = chunk[start:end].decode(encoding)
+        if not keywords.isdisjoint(line.lower().split()):
+            yield start, line
+
+
+def _iter_chunks(data: mmap.mmap, start: int, end: int, chunk_size: int) -> Iterator[Tuple[int, bytes]]:
+    position = start
+    while position < end:
+        stop = min(position + chunk_size, end)
+
+        if stop < end:
+            # Chunks end after \n or a lone \r and never between the two bytes of \r\n.
+            newline = data.rfind(b'\n', position, stop)
+            newline = max(newline, data.rfind(b'\r', max(newline, position), stop))
+            if newline == -1:
+                newline = data.find(b'\n', stop, end)
+                carriage = data.find(b'\r', stop, end if newline == -1 else newline)
+                if carriage != -1:
+                    newline = carriage
+
+            if newline != -1 and newline + 1 < end and data[newline:newline + 2] == b'\r\n':
+                newline += 1
+            stop = end if newline == -1 else newline + 1
+
+        yield position, data[position:stop]
+        position = stop
+
+
+def search_lines_mmap(file: Union[BinaryIO, str], words: List[str], chunk_size: int = 1 << 24,
+                      encoding: str = 'utf-8') -> Iterator[str]:
+    _check_words(words)
+
+    if not isinstance(file, (BufferedIOBase, RawIOBase)) and not isinstance(file, str):
+        raise TypeError
+
+    if not isinstance(chunk_size, int):
+        raise TypeError
+
+    if chunk_size <= 0:
+        raise ValueError('chunk_size must be positive')
+
+    if isinstance(file, str):
+        f = open(file, 'rb')
+    else:
+        f = file
+
+    try:
+        keywords, pattern = _compile_keywords(words, encoding)
+
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Empty files cannot be memory-mapped.
+            return
+
+        with data:
+            for _, chunk in _iter_chunks(data, 0, len(data), chunk_size):
+                for _, line in _scan_chunk(_normalize_newlines(chunk), keywords, pattern, encoding):
+                    yield line
+    finally:
+        if isinstance(file, str):
+            f.close()
+
+
+def _iter_ranges(paths: Iterable[str], range_size: int) -> Iterator[Tuple[int, str, int, int, int, bool]]:
+    for number, path in enumerate(paths):
+        if not isinstance(path, str):
+            raise TypeError
+
+        with open(path, 'rb') as f:
+            size = os.fstat(f.fileno()).st_size
+            index = 0
+            start = 0
+            while start < size:
+                f.seek(min(start + range_size, size))
+                if f.tell() < size:
+                    f.readline()
+                end = f.tell()
+
+                yield number, path, index, start, end, end >= size
+                index += 1
+                start = end
+
+
+def _search_range(path: str, start: int, end: int, words: List[str], chunk_size: int,
+                  encoding: str) -> Tuple[List[Tuple[int, str]], int]:
+    keywords, pattern = _compile_keywords(words, encoding)
+    matches = []
+    newlines = 0
+
+    with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as data:
+        for _, chunk in _iter_chunks(data, start, end, chunk_size):
+            # Counted after the translation, so line numbers follow the universal newlines of text mode.
+            chunk = _normalize_newlines(chunk)
+            position = 0
+            for line_start, line in _scan_chunk(chunk, keywords, pattern, encoding):
+                newlines += chunk.count(b'\n', position, line_start)
+                position = line_start
+                matches.append((newlines, line))
+            newlines += chunk.count(b'\n', position)
+
+    return matches, newlines
+
+
+def _emit_range(task: Tuple[int, str, int, int, int, bool], result: Tuple[List[Tuple[int, str]], int],
+                offsets: dict) -> Iterator[Tuple[str, int, str]]:
+    number, path, index, _, _, last = task
+    matches, newlines = result
+
+    offset = offsets.pop(number, 0) if index else 0
+    if not last:
+        offsets[number] = offset + newlines
+
+    for line_index, line in matches:
+        yield path, offset + line_index + 1, line
+
+
+def search_files(paths: Iterable[str], words: List[str], workers: Optional[int] = None, ordered: bool = True,
+                 range_size: int = 1 << 26, chunk_size: int = 1 << 24,
+                 encoding: str = 'utf-8') -> Iterator[Tuple[str, int, str]]:
+    _check_words(words)
+
+    if isinstance(paths, str):
+        raise TypeError
+
+    if not isinstance(range_size, int) or not isinstance(chunk_size, int):
+        raise TypeError
+
+    if range_size <= 0 or chunk_size <= 0:
+        raise ValueError('range_size and chunk_size must be positive')
+
+    if workers is not None:
+        if not isinstance(workers, int):
+            raise TypeError
+
+        if workers <= 0:
+            raise ValueError('workers must be positive')
+
+    # Results which have been submitted but not yet yielded, buffered ones included,
+    # never exceed the window, so memory does not depend on the number of paths.
+    window = 2 * (workers or os.cpu_count() or 1)
+    ranges = _iter_ranges(paths, range_size)
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        def submit(task):
+            _, path, _, start, end, _ = task
+            return executor.submit(_search_range, path, start, end, words, chunk_size, encoding)
+
+        offsets = {}
+
+        if ordered:
+            pending = deque()
+            for task in ranges:
+                if len(pending) >= window:
+                    task_done, future = pending.popleft()
+                    yield from _emit_range(task_done, future.result(), offsets)
+                pending.append((task, submit(task)))
+
+            while pending:
+                task_done, future = pending.popleft()
+                yield from _emit_range(task_done, future.result(), offsets)
+        else:
+            # Ranges of one file are still emitted in order, because line numbers
+            # of a range depend on the newline count of the ranges before it.
+            running = {}
+            next_index = {}
+            finished = {}
+            exhausted = False
+
+            while True:
+                while not exhausted and len(running) + len(finished) < window:
+                    task = next(ranges, None)
+                    if task is None:
+                        exhausted = True
+                    else:
+                        running[submit(task)] = task
+                        next_index[task[0]] = next_index.get(task[0], 0)
+
+                if not running:
+                    break
+
+                done, _ = wait(running, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = running.pop(future)
+                    finished[task[0], task[2]] = (task, future.result())
+
+                    number = task[0]
+                    while (number, next_index.get(number)) in finished:
+                        ready_task, result = finished.pop((number, next_index[number]))
+                        next_index[number] += 1
+                        yield from _emit_range(ready_task, result, offsets)
+                        if ready_task[5]:
+                            del next_index[number]
+
+
+class LineFollower:
+    def __init__(self, path: str, words: List[str], from_start: bool = True, encoding: str = 'utf-8',
+                 chunk_size: int = 1 << 20) -> None:
+        _check_words(words)
+
+        if not isinstance(path, str) or not isinstance(chunk_size, int):
+            raise TypeError
+
+        if chunk_size <= 0:
+            raise ValueError('chunk_size must be positive')
+
+        self.path = path
+        self.from_start = from_start
+        self.encoding = encoding
+        self.chunk_size = chunk_size
+        self.keywords, self.pattern = _compile_keywords(words, encoding)
+        self.file = None
+        self.inode = None
+        self.offset = 0
+        self.buffer = b''
+        self.polled = False
+
+    def _open(self, from_start: bool) -> bool:
+        try:
+            self.file = open(self.path, 'rb')
+        except FileNotFoundError:
+            return False
+
+        stat = os.fstat(self.file.fileno())
+        self.inode = (stat.st_dev, stat.st_ino)
+        self.offset = 0 if from_start else stat.st_size
+        self.file.seek(self.offset)
+        self.buffer = b''
+        return True
+
+    def _read(self) -> List[str]:
+        # Appended data is read in blocks, so only one block and the unfinished line after it
+        # are held in memory, however much was written since the last poll.
+        result = []
+        data = self.file.read(self.chunk_size)
+        while data:
+            self.offset += len(data)
+            data = self.buffer + data
+            # A \r at the end of the data is kept back, it may be the start of \r\n.
+            end = max(data.rfind(b'\n'), data.rfind(b'\r', 0, len(data) - 1)) + 1
+            self.buffer = data[end:]
+
+            lines = _scan_chunk(_normalize_newlines(data[:end]), self.keywords, self.pattern, self.encoding)
+            result.extend(line for _, line in lines)
+            data = self.file.read(self.chunk_size)
+
+        return result
+
+    def _flush(self) -> List[str]:
+        data, self.buffer = _normalize_newlines(self.buffer), b''
+        return [line for _, line in _scan_chunk(data, self.keywords, self.pattern, self.encoding)]
+
+    def poll(self) -> List[str]:
+        if self.file is None:
+            # Only a file present at the first poll may have its existing data skipped,
+            # files appearing later are read fully.
+            opened = self._open(self.from_start or self.polled)
+            self.polled = True
+            if not opened:
+                return []
+
+        result = self._read()
+
+        try:
+            stat = os.stat(self.path)
+        except FileNotFoundError:
+            stat = None
+
+        if stat is None or (stat.st_dev, stat.st_ino) != self.inode:
+            # The file was rotated: the old handle is drained, then the new file is read from the start.
+            result.extend(self._read())
+            result.extend(self._flush())
+            self.file.close()
+            self.file = None
+            if stat is not None and self._open(True):
+                result.extend(self._read())
+        elif stat.st_size < self.offset:
+            # The file was truncated in place.
+            self.file.seek(0)
+            self.offset = 0
+            self.buffer = b''
+            result.extend(self._read())
+
+        return result
+
+    def close(self) -> None:
+        if self.file is not None:
+            self.file.close()
+            self.file = None
+
+
+def _check_intervals(poll_interval: float, max_interval: float) -> None:
+    if not isinstance(poll_interval, (int, float)) or not isinstance(max_interval, (int, float)):
+        raise TypeError
+
+    if poll_interval <= 0 or max_interval < poll_interval:
+        raise ValueError('poll_interval must be positive and not greater than max_interval')
+
+
+def follow_lines(path: str, words: List[str], poll_interval: float = 0.1, max_interval: float = 2.0,
+                 from_start: bool = True, encoding: str = 'utf-8', chunk_size: int = 1 << 20) -> Iterator[str]:
+    _check_intervals(poll_interval, max_interval)
+    follower = LineFollower(path, words, from_start, encoding, chunk_size)
+    interval = poll_interval
+
+    try:
+        while True:
+            position = (follower.inode, follower.offset)
+            lines = follower.poll()
+            yield from lines
+
+            if lines or position != (follower.inode, follower.offset):
+                interval = poll_interval
+            else:
+                time.sleep(interval)
+                interval = min(interval * 2, max_interval)
+    finally:
+        follower.close()
+
+
+async def afollow_lines(path: str, words: List[str], poll_interval: float = 0.1, max_interval: float = 2.0,
+                        from_start: bool = True, encoding: str = 'utf-8',
+                        chunk_size: int = 1 << 20) -> AsyncIterator[str]:
+    _check_intervals(poll_interval, max_interval)
+    follower = LineFollower(path, words, from_start, encoding, chunk_size)
+    interval = poll_interval
+
+    try:
+        while True:
+            position = (follower.inode, follower.offset)
+            lines = follower.poll()
+            for line in lines:
+                yield line
+
+            if lines or position != (follower.inode, follower.offset):
+                interval = poll_interval
+            else:
+                await asyncio.sleep(interval)
+                interval = min(interval * 2, max_interval)
+    finally:
+        follower.close()
@@ -1,8 +1,9 @@
+import asyncio
 import io
 import os
 import unittest
 import tempfile
-from file_generator import search_lines
+from file_generator import search_lines, search_lines_mmap, search_files, LineFollower, follow_lines, afollow_lines
 
 
 class TestSearchLines(unittest.TestCase):
@@ -110,6 +111,20 @@ class TestSearchLines(unittest.TestCase):
             self.assertEqual(position, len("The quick brown fox\njumps over the lazy dog"))
         self.assertTrue(file.closed)
 
+    def test_large_watchlist_matches_word_by_word_search(self):
+        lines = ['Word%d and WORD%d appear here' % (i, i * 7) for i in range(300)] + ['nothing to see', '']
+        search_words = ['word%d' % i for i in range(0, 2000, 3)] + ['Nothing', 'word5', 'word5']
+
+        expected = []
+        for line in lines:
+            for word in search_words:
+                if word.lower() in line.lower().split():
+                    expected.append(line)
+                    break
+
+        file = io.StringIO('\n'.join(lines) + '\n')
+        self.assertEqual(list(search_lines(file, search_words)), expected)
+
     def test_invalid_parameters(self):
         file = io.StringIO('apples are good bananas are also good oranges are not as good')
         search_words = 'fjdksjfdg'
@@ -137,5 +152,298 @@ class TestSearchLines(unittest.TestCase):
             list(search_lines(file, search_words))
 
 
+class TestSearchLinesMmap(unittest.TestCase):
+    def setUp(self):
+        self.lines = ['The quick brown fox', 'Jumps over the lazy dog', 'A rose fell on the paw of Azor', '',
+                      'Роза упала на лапу Азора', 'ПРИВЕТ мир', 'foxes are not a fox-match',
+                      'a very long line ' * 20 + 'with a fox at the end', 'tabs\tand\x1cseparators\x1cFOX']
+        self.search_words = ['fox', 'rose', 'азора', 'привет', 'separators']
+
+    def _write(self, data):
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(data)
+        self.addCleanup(os.remove, f.name)
+        return f.name
+
+    def test_same_result_as_search_lines(self):
+        for ending in ['\n', '']:
+            name = self._write(('\n'.join(self.lines) + ending).encode('utf-8'))
+            with open(name, 'r', encoding='utf-8') as f:
+                expected = list(search_lines(f, self.search_words))
+
+            for chunk_size in [1, 7, 16, 64, 1 << 20]:
+                result = list(search_lines_mmap(name, self.search_words, chunk_size=chunk_size))
+                self.assertEqual(result, expected)
+
+    def test_expected_lines(self):
+        name = self._write(('\n'.join(self.lines) + '\n').encode('utf-8'))
+        result = list(search_lines_mmap(name, self.search_words, chunk_size=32))
+        self.assertEqual(result, ['The quick brown fox', 'A rose fell on the paw of Azor', 'Роза упала на лапу Азора',
+                                  'ПРИВЕТ мир', self.lines[7], self.lines[8]])
+
+    def test_crlf_line_endings(self):
+        name = self._write(b'apples are good\r\nbananas are also good\r\n')
+        result = list(search_lines_mmap(name, ['bananas']))
+        self.assertEqual(result, ['bananas are also good'])
+
+    def test_universal_newlines(self):
+        contents = [b'fox one\rbar two\rfox three\n', b'fox one\r\nfox two\r\r\nbar\n\rfox three\r',
+                    b'\r\r\nfox\r\n\n\rfox\rfox']
+        for content in contents:
+            name = self._write(content)
+            with open(name, 'r', encoding='utf-8') as f:
+                expected = list(search_lines(f, ['fox']))
+
+            for chunk_size in range(1, len(content) + 1):
+                result = list(search_lines_mmap(name, ['fox'], chunk_size=chunk_size))
+                self.assertEqual(result, expected, (content, chunk_size))
+
+        self.assertEqual(expected, ['fox', 'fox', 'fox'])
+
+    def test_binary_file_object(self):
+        name = self._write(b'apples are good\nbananas are also good\n')
+        with open(name, 'rb') as f:
+            result = list(search_lines_mmap(f, ['apples']))
+            self.assertFalse(f.closed)
+        self.assertEqual(result, ['apples are good'])
+
+    def test_empty_file_and_words(self):
+        name = self._write(b'')
+        self.assertEqual(list(search_lines_mmap(name, ['apples'])), [])
+
+        name = self._write(b'apples are good\n')
+        self.assertEqual(list(search_lines_mmap(name, [])), [])
+
+    def test_invalid_parameters(self):
+        name = self._write(b'apples are good\n')
+        with self.assertRaises(TypeError):
+            list(search_lines_mmap(name, 'apples'))
+
+        with self.assertRaises(TypeError):
+            list(search_lines_mmap(io.StringIO('apples'), ['apples']))
+
+        with self.assertRaises(ValueError):
+            list(search_lines_mmap(name, ['apples'], chunk_size=0))
+
+        with self.assertRaises(FileNotFoundError):
+            list(search_lines_mmap('fdksfjjd', ['apples']))
+
+
+class TestSearchFiles(unittest.TestCase):
+    def setUp(self):
+        self.paths = []
+        self.expected = []
+        for number in range(4):
+            lines = [f'line {i} of file {number}' + (' fox' if i % 5 == number else '') for i in range(60)]
+            with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+                f.write('\n'.join(lines) + '\n')
+            self.addCleanup(os.remove, f.name)
+            self.paths.append(f.name)
+            self.expected.extend((f.name, i + 1, line) for i, line in enumerate(lines) if line.endswith('fox'))
+
+        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
+            pass
+        self.addCleanup(os.remove, f.name)
+        self.paths.insert(2, f.name)
+
+    def test_ordered(self):
+        result = list(search_files(self.paths, ['FOX'], workers=2))
+        self.assertEqual(result, self.expected)
+
+    def test_ordered_with_byte_ranges(self):
+        result = list(search_files(iter(self.paths), ['fox'], workers=2, range_size=50, chunk_size=20))
+        self.assertEqual(result, self.expected)
+
+    def test_unordered(self):
+        result = list(search_files(self.paths, ['fox'], workers=3, ordered=False, range_size=100))
+        self.assertEqual(sorted(result), sorted(self.expected))
+
+        for path in self.paths:
+            lines = [line_number for name, line_number, _ in result if name == path]
+            self.assertEqual(lines, sorted(lines))
+
+    def test_same_path_twice(self):
+        result = list(search_files(self.paths[:1] * 2, ['fox'], workers=2, ordered=False, range_size=64))
+        expected = [item for item in self.expected if item[0] == self.paths[0]]
+        self.assertEqual(sorted(result), sorted(expected * 2))
+
+    def test_line_numbers_match_file(self):
+        for path, line_number, line in search_files(self.paths, ['fox'], range_size=70):
+            with open(path) as f:
+                self.assertEqual(f.read().split('\n')[line_number - 1], line)
+
+    def test_universal_newlines(self):
+        with tempfile.NamedTemporaryFile(mode='wb', delete=False) as f:
+            f.write(b'fox one\rbar two\rfox three\n' * 3 + b'fox\r\n\r\nbar\r\rfox four\r\nfox five')
+        self.addCleanup(os.remove, f.name)
+
+        with open(f.name) as text:
+            expected = [(f.name, number, line.rstrip('\n')) for number, line in enumerate(text, 1) if 'fox' in line]
+
+        for range_size, chunk_size in [(1 << 20, 1 << 20), (30, 7), (8, 1), (1, 3)]:
+            result = list(search_files([f.name], ['fox'], workers=2, range_size=range_size, chunk_size=chunk_size))
+            self.assertEqual(result, expected, (range_size, chunk_size))
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(TypeError):
+            list(search_files(self.paths[0], ['fox']))
+
+        with self.assertRaises(TypeError):
+            list(search_files(self.paths, 'fox'))
+
+        with self.assertRaises(ValueError):
+            list(search_files(self.paths, ['fox'], workers=0))
+
+        with self.assertRaises(TypeError):
+            list(search_files(self.paths, ['fox'], workers='2'))
+
+        with self.assertRaises(FileNotFoundError):
+            list(search_files(['fdksfjjd'], ['fox']))
+
+
+class TestFollowLines(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+        self.path = os.path.join(self.directory.name, 'app.log')
+
+    def _append(self, data, path=None):
+        with open(path or self.path, 'a') as f:
+            f.write(data)
+
+    def test_poll_reads_only_appended_lines(self):
+        self._append('fox one\nno match\n')
+        follower = LineFollower(self.path, ['fox'])
+        self.addCleanup(follower.close)
+
+        self.assertEqual(follower.poll(), ['fox one'])
+        self.assertEqual(follower.poll(), [])
+
+        self._append('fox two\npartial fox')
+        self.assertEqual(follower.poll(), ['fox two'])
+
+        self._append(' line\n')
+        self.assertEqual(follower.poll(), ['partial fox line'])
+
+    def test_poll_from_end(self):
+        self._append('fox one\n')
+        follower = LineFollower(self.path, ['fox'], from_start=False)
+        self.addCleanup(follower.close)
+
+        self.assertEqual(follower.poll(), [])
+        self._append('fox two\n')
+        self.assertEqual(follower.poll(), ['fox two'])
+
+    def test_poll_missing_file(self):
+        follower = LineFollower(self.path, ['fox'], from_start=False)
+        self.addCleanup(follower.close)
+
+        self.assertEqual(follower.poll(), [])
+        self._append('fox one\n')
+        self.assertEqual(follower.poll(), ['fox one'])
+
+    def test_poll_survives_rotation(self):
+        self._append('fox one\n')
+        follower = LineFollower(self.path, ['fox'])
+        self.addCleanup(follower.close)
+        self.assertEqual(follower.poll(), ['fox one'])
+
+        self._append('fox two\n')
+        os.rename(self.path, self.path + '.1')
+        self._append('fox three\n')
+        self.assertEqual(follower.poll(), ['fox two', 'fox three'])
+
+        self._append('fox four\n')
+        self.assertEqual(follower.poll(), ['fox four'])
+
+    def test_poll_truncation(self):
+        self._append('fox one\nfox two\n')
+        follower = LineFollower(self.path, ['fox'])
+        self.addCleanup(follower.close)
+        self.assertEqual(follower.poll(), ['fox one', 'fox two'])
+
+        with open(self.path, 'w') as f:
+            f.write('fox\n')
+        self.assertEqual(follower.poll(), ['fox'])
+
+    def test_poll_reads_in_blocks(self):
+        self._append('fox one\nno match at all\n' * 50 + 'a fox in a line longer than one block\npartial')
+        follower = LineFollower(self.path, ['fox'], chunk_size=8)
+        self.addCleanup(follower.close)
+        follower.poll()
+
+        sizes = []
+        read = follower.file.read
+
+        def recording_read(size=-1):
+            sizes.append(size)
+            return read(size)
+
+        follower.file.read = recording_read
+        follower.file.seek(0)
+        follower.offset = 0
+        follower.buffer = b''
+
+        self.assertEqual(follower.poll(), ['fox one'] * 50 + ['a fox in a line longer than one block'])
+        self.assertTrue(sizes and all(size == 8 for size in sizes))
+        self.assertEqual(follower.offset, os.path.getsize(self.path))
+        self.assertEqual(follower.buffer, b'partial')
+
+        self._append(' fox\n')
+        self.assertEqual(follower.poll(), ['partial fox'])
+
+    def test_poll_universal_newlines(self):
+        self._append('fox one\rbar\rfox two\r')
+        follower = LineFollower(self.path, ['fox'], chunk_size=4)
+        self.addCleanup(follower.close)
+        self.assertEqual(follower.poll(), ['fox one'])
+
+        self._append('\nfox three\r\nfox four')
+        self.assertEqual(follower.poll(), ['fox two', 'fox three'])
+
+        os.rename(self.path, self.path + '.1')
+        self.assertEqual(follower.poll(), ['fox four'])
+
+    def test_follow_lines(self):
+        self._append('fox one\nno match\nfox two\n')
+        lines = follow_lines(self.path, ['fox'], poll_interval=0.001, max_interval=0.01)
+        self.assertEqual([next(lines), next(lines)], ['fox one', 'fox two'])
+
+        self._append('fox three\n')
+        self.assertEqual(next(lines), 'fox three')
+        lines.close()
+
+    def test_afollow_lines(self):
+        async def follow():
+            lines = afollow_lines(self.path, ['fox'], poll_interval=0.001, max_interval=0.01)
+            result = [await lines.__anext__()]
+            self._append('fox two\n')
+            result.append(await lines.__anext__())
+            await lines.aclose()
+            return result
+
+        self._append('fox one\n')
+        self.assertEqual(asyncio.run(follow()), ['fox one', 'fox two'])
+
+    def test_invalid_parameters(self):
+        with self.assertRaises(TypeError):
+            LineFollower(self.path, 'fox')
+
+        with self.assertRaises(TypeError):
+            LineFollower(123, ['fox'])
+
+        with self.assertRaises(TypeError):
+            LineFollower(self.path, ['fox'], chunk_size='8')
+
+        with self.assertRaises(ValueError):
+            LineFollower(self.path, ['fox'], chunk_size=0)
+
+        with self.assertRaises(ValueError):
+            next(follow_lines(self.path, ['fox'], poll_interval=0))
+
+        with self.assertRaises(ValueError):
+            next(follow_lines(self.path, ['fox'], poll_interval=1, max_interval=0.5))
+
+
 if __name__ == '__main__':
     unittest.main()
@@ -0,0 +1,55 @@
+import argparse
+import os
+import random
+import tempfile
+import timeit
+from file_generator import search_lines, search_lines_mmap
+
+
+WORDS = ['error', 'warning', 'request', 'response', 'user', 'timeout', 'connection', 'database', 'cache',
+         'session', 'token', 'payload', 'handler', 'worker', 'queue', 'retry', 'status', 'latency']
+
+
+def generate_file(path: str, size: int) -> None:
+    rng = random.Random(0)
+    lines = [' '.join(rng.choice(WORDS) for _ in range(rng.randint(5, 15))) + f' id{i}\n' for i in range(10000)]
+    block = ''.join(lines).encode('utf-8')
+
+    with open(path, 'wb') as f:
+        written = 0
+        while written < size:
+            f.write(block)
+            written += len(block)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare search_lines and search_lines_mmap on a generated file')
+    parser.add_argument('--size', type=int, default=1 << 30, help='size of the generated file in bytes')
+    parser.add_argument('--words', nargs='+', default=['id42', 'id4242', 'ID9999'], help='words to search for')
+    args = parser.parse_args()
+
+    fd, path = tempfile.mkstemp(suffix='.log')
+    os.close(fd)
+
+    try:
+        generate_file(path, args.size)
+        print(f'Generated {os.path.getsize(path) / (1 << 20):.0f} MiB file')
+
+        text_count = []
+        mmap_count = []
+        text_time = timeit.timeit(lambda: text_count.append(sum(1 for _ in search_lines(path, args.words))), number=1)
+        mmap_time = timeit.timeit(lambda: mmap_count.append(sum(1 for _ in search_lines_mmap(path, args.words))),
+                                  number=1)
+
+        if text_count != mmap_count:
+            raise RuntimeError(f'Results differ: {text_count[0]} vs {mmap_count[0]} lines')
+
+        print(f'Matched lines: {text_count[0]}')
+        print(f'search_lines time: {text_time:.3f} seconds')
+        print(f'search_lines_mmap time: {mmap_time:.3f} seconds')
+    finally:
+        os.remove(path)
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,43 @@
+import random
+import timeit
+from json_filter import JSON_BACKENDS, JsonKeywordFilter, get_json_backend
+
+
+NUM_JSON = 20000
+JSON_SIZE = 20
+
+
+def generate_documents():
+    rng = random.Random(0)
+    vocabulary = [f'word{i}' for i in range(500)]
+
+    documents = []
+    for _ in range(NUM_JSON):
+        fields = [f'"field{j}": "{" ".join(rng.choices(vocabulary, k=8))}"' for j in range(JSON_SIZE)]
+        documents.append('{' + ', '.join(fields) + '}')
+
+    return documents
+
+
+def main() -> None:
+    documents = generate_documents()
+    required_fields = [f'field{j}' for j in range(0, JSON_SIZE, 3)]
+    keywords = [f'word{i}' for i in range(0, 500, 7)]
+
+    default = next(name for name, loads in JSON_BACKENDS.items() if loads is get_json_backend())
+    print(f'Available backends: {", ".join(JSON_BACKENDS)} (default: {default})')
+
+    for backend in JSON_BACKENDS:
+        json_filter = JsonKeywordFilter(required_fields, keywords, backend)
+        loads = json_filter.loads
+
+        loads_time = timeit.timeit(lambda: [loads(document) for document in documents], number=1)
+        filter_time = timeit.timeit(lambda: [json_filter.parse(document, None, batch_callback=len)
+                                             for document in documents], number=1)
+
+        print(f'{backend} loads time: {loads_time:.3f} seconds')
+        print(f'{backend} filter time: {filter_time:.3f} seconds')
+
+
+if __name__ == '__main__':
+    main()
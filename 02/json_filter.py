@@ -1,40 +1,298 @@
 import json
-from typing import List, Optional, Callable, Any
+import os
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Optional, Callable, Any, Iterable, IO, Tuple, Union
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import cjson
+except ImportError:
+    cjson = None
+
+
+def _cjson_loads(json_str: Union[str, bytes]) -> Any:
+    if isinstance(json_str, bytes):
+        json_str = json_str.decode('utf-8')
+
+    # cjson handles only flat objects without escape sequences, everything else goes to stdlib.
+    if '\\' not in json_str:
+        try:
+            return cjson.loads(json_str)
+        except (TypeError, ValueError):
+            pass
+
+    return json.loads(json_str)
+
+
+def _orjson_loads(json_str: Union[str, bytes]) -> Any:
+    # orjson is stricter than the stdlib (no NaN/Infinity, no lone surrogates), such
+    # documents are retried with json so that every backend accepts the same input.
+    try:
+        return orjson.loads(json_str)
+    except orjson.JSONDecodeError:
+        return json.loads(json_str)
+
+
+JSON_BACKENDS = {'json': json.loads}
+if cjson is not None:
+    JSON_BACKENDS['cjson'] = _cjson_loads
+if orjson is not None:
+    JSON_BACKENDS['orjson'] = _orjson_loads
+
+
+def get_json_backend(backend: Optional[str] = None) -> Callable[[Union[str, bytes]], Any]:
+    if backend is None:
+        for name in ('orjson', 'cjson', 'json'):
+            if name in JSON_BACKENDS:
+                return JSON_BACKENDS[name]
+
+    if backend not in JSON_BACKENDS:
+        raise ValueError(f"Unknown or unavailable JSON backend: {backend}")
+
+    return JSON_BACKENDS[backend]
 
 
 def keyword_callback(word: str, field: str) -> Any:
     pass
 
 
-def parse_json(json_str: str, keyword_callback: Callable, required_fields: Optional[List[str]] = None,
-               keywords: Optional[List[str]] = None) -> None:
+def _check_callbacks(keyword_callback: Optional[Callable], batch_callback: Optional[Callable]) -> None:
+    if batch_callback is None:
+        if not callable(keyword_callback):
+            raise TypeError
+    elif not callable(batch_callback):
+        raise TypeError
+
+
+class JsonKeywordFilter:
+    def __init__(self, required_fields: List[str], keywords: List[str], backend: Optional[str] = None) -> None:
+        if (not isinstance(required_fields, List)) or (not isinstance(keywords, List)):
+            raise TypeError
+        else:
+            if (not all(isinstance(elem, str) for elem in keywords)) or \
+               (not all(isinstance(elem, str) for elem in required_fields)):
+                raise TypeError
+
+        self.loads = get_json_backend(backend)
+        self.required_fields = frozenset(required_fields)
+        self.keywords = frozenset(keywords)
+        self._keyword_order = {}
+        for index, word in enumerate(keywords):
+            self._keyword_order.setdefault(word, index)
+
+        # Dotted fields are compiled into a tree of path segments, so matching walks only the
+        # requested branches of a document. Each node is [field name or None, children].
+        self._paths = {}
+        for field in self.required_fields:
+            if '.' in field:
+                self._paths.setdefault(field, [None, {}])[0] = field
+
+            children = self._paths
+            segments = field.split('.')
+            for segment in segments[:-1]:
+                children = children.setdefault(segment, [None, {}])[1]
+            children.setdefault(segments[-1], [None, {}])[0] = field
+
+    def _walk(self, paths: dict, json_doc: dict, hits: List[Tuple[str, str]]) -> None:
+        for key, value in json_doc.items():
+            node = paths.get(key)
+            if node is None:
+                continue
+
+            field, children = node
+            if isinstance(value, str):
+                if field is not None:
+                    found = self.keywords.intersection(value.split(' '))
+                    if found:
+                        hits.extend((word, field) for word in sorted(found, key=self._keyword_order.__getitem__))
+            elif children and isinstance(value, dict):
+                self._walk(children, value, hits)
+
+    def match(self, json_doc: dict) -> List[Tuple[str, str]]:
+        if not isinstance(json_doc, dict):
+            raise ValueError("JSON document must be an object")
+
+        hits = []
+        self._walk(self._paths, json_doc, hits)
+        return hits
+
+    def parse(self, json_str: str, keyword_callback: Optional[Callable],
+              batch_callback: Optional[Callable[[List[Tuple[str, str]]], Any]] = None) -> None:
+        if not isinstance(json_str, str):
+            raise TypeError
+
+        _check_callbacks(keyword_callback, batch_callback)
+
+        hits = self.match(self.loads(json_str))
+
+        if batch_callback is not None:
+            if hits:
+                batch_callback(hits)
+        else:
+            for word, field in hits:
+                keyword_callback(word, field)
+
+
+def parse_json(json_str: str, keyword_callback: Optional[Callable], required_fields: Optional[List[str]] = None,
+               keywords: Optional[List[str]] = None,
+               batch_callback: Optional[Callable[[List[Tuple[str, str]]], Any]] = None,
+               backend: Optional[str] = None) -> None:
     if (required_fields is None) or (keywords is None):
         return
 
     if not isinstance(json_str, str):
         raise TypeError
 
-    if (not isinstance(required_fields, List)) or (not isinstance(keywords, List)):
+    JsonKeywordFilter(required_fields, keywords, backend).parse(json_str, keyword_callback, batch_callback)
+
+
+_worker_filter: Optional[JsonKeywordFilter] = None
+
+
+def _init_worker(required_fields: List[str], keywords: List[str], backend: Optional[str]) -> None:
+    global _worker_filter
+    _worker_filter = JsonKeywordFilter(required_fields, keywords, backend)
+
+
+def _match_chunk(json_strs: List[str]) -> List[List[Tuple[str, str]]]:
+    result = []
+    for json_str in json_strs:
+        if not isinstance(json_str, str):
+            raise TypeError
+
+        result.append(_worker_filter.match(_worker_filter.loads(json_str)))
+
+    return result
+
+
+def _iter_chunks(json_strs: Iterable[str], chunk_size: int) -> Iterable[List[str]]:
+    chunk = []
+    for json_str in json_strs:
+        chunk.append(json_str)
+        if len(chunk) == chunk_size:
+            yield chunk
+            chunk = []
+
+    if chunk:
+        yield chunk
+
+
+def parse_json_parallel(json_strs: Iterable[str], keyword_callback: Optional[Callable],
+                        required_fields: Optional[List[str]] = None, keywords: Optional[List[str]] = None,
+                        workers: Optional[int] = None, chunk_size: int = 1000,
+                        batch_callback: Optional[Callable[[List[Tuple[str, str]]], Any]] = None,
+                        backend: Optional[str] = None) -> None:
+    if (required_fields is None) or (keywords is None):
+        return
+
+    if isinstance(json_strs, (str, bytes)):
+        raise TypeError
+
+    if not isinstance(chunk_size, int):
         raise TypeError
+
+    if chunk_size <= 0:
+        raise ValueError("chunk_size must be positive")
+
+    if workers is not None:
+        if not isinstance(workers, int):
+            raise TypeError
+
+        if workers <= 0:
+            raise ValueError("workers must be positive")
+
+    JsonKeywordFilter(required_fields, keywords, backend)
+    _check_callbacks(keyword_callback, batch_callback)
+
+    window = 2 * (workers or os.cpu_count() or 1)
+
+    def dispatch(future):
+        for hits in future.result():
+            if batch_callback is not None:
+                if hits:
+                    batch_callback(hits)
+            else:
+                for word, field in hits:
+                    keyword_callback(word, field)
+
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(required_fields, keywords, backend)) as executor:
+        pending = deque()
+        for chunk in _iter_chunks(json_strs, chunk_size):
+            if len(pending) >= window:
+                dispatch(pending.popleft())
+            pending.append(executor.submit(_match_chunk, chunk))
+
+        while pending:
+            dispatch(pending.popleft())
+
+
+def _iter_records(source: Union[IO, Iterable[Union[bytes, str]]], chunk_size: int) -> Iterable[bytes]:
+    if hasattr(source, 'read'):
+        chunks = iter(lambda: source.read(chunk_size), source.read(0))
     else:
-        if (not all(isinstance(elem, str) for elem in keywords)) or \
-           (not all(isinstance(elem, str) for elem in required_fields)):
+        chunks = source
+
+    tail = b''
+    for chunk in chunks:
+        if isinstance(chunk, str):
+            chunk = chunk.encode('utf-8')
+        elif not isinstance(chunk, (bytes, bytearray)):
             raise TypeError
 
-    if not callable(keyword_callback):
+        lines = (tail + chunk).split(b'\n')
+        tail = lines.pop()
+        for line in lines:
+            if line.strip():
+                yield line
+
+    if tail.strip():
+        yield tail
+
+
+def parse_json_stream(source: Union[IO, Iterable[Union[bytes, str]]], keyword_callback: Optional[Callable],
+                      required_fields: Optional[List[str]] = None, keywords: Optional[List[str]] = None,
+                      chunk_size: int = 1 << 20,
+                      batch_callback: Optional[Callable[[List[Tuple[str, str]]], Any]] = None,
+                      batch_size: int = 1, backend: Optional[str] = None) -> None:
+    if (required_fields is None) or (keywords is None):
+        return
+
+    if isinstance(source, (str, bytes)):
         raise TypeError
 
-    json_doc = json.loads(json_str)
+    if (not isinstance(chunk_size, int)) or (not isinstance(batch_size, int)):
+        raise TypeError
 
-    if not all(isinstance(elem, str) for elem in json_doc.values()):
-        raise ValueError("This is non primitive json string")
+    if chunk_size <= 0 or batch_size <= 0:
+        raise ValueError("chunk_size and batch_size must be positive")
 
-    for field in json_doc.keys():
-        if field not in required_fields:
-            continue
+    json_filter = JsonKeywordFilter(required_fields, keywords, backend)
 
-        field_value = json_doc[field].split(' ')
+    _check_callbacks(keyword_callback, batch_callback)
 
-        for word in keywords:
-            if word in field_value:
+    if batch_callback is None:
+        for record in _iter_records(source, chunk_size):
+            for word, field in json_filter.match(json_filter.loads(record)):
                 keyword_callback(word, field)
+        return
+
+    hits = []
+    documents = 0
+    for record in _iter_records(source, chunk_size):
+        hits.extend(json_filter.match(json_filter.loads(record)))
+        documents += 1
+
+        if documents == batch_size:
+            if hits:
+                batch_callback(hits)
+                hits = []
+            documents = 0
+
+    if hits:
+        batch_callback(hits)
@@ -1,9 +1,15 @@
+import io
+import os
+import sys
 import unittest
 import random
 import json
+import math
 from unittest import mock
 from faker import Faker
-from json_filter import parse_json
+import json_filter
+from json_filter import JsonKeywordFilter, JSON_BACKENDS, get_json_backend, keyword_callback, parse_json, \
+    parse_json_stream, parse_json_parallel
 
 
 class TestParseJson(unittest.TestCase):
@@ -148,17 +154,49 @@ class TestParseJson(unittest.TestCase):
 
     def test_parse_json_with_non_primitive_json_str(self):
         with mock.patch('json_filter.keyword_callback') as func:
-            with self.assertRaises(ValueError) as err:
-                parse_json('{"fadjj": ["jfadh", "hafjkhds", "hafjgfhjd"]}', func, required_fields=['a', 'b', 'c'],
-                           keywords=['a', 'b', 'c'])
+            parse_json('{"fadjj": ["jfadh", "hafjkhds", "hafjgfhjd"], "a": 12, "b": null}', func,
+                       required_fields=['a', 'b', 'c', 'fadjj'], keywords=['a', 'b', 'c', 'jfadh', '12'])
+            self.assertEqual(func.call_count, 0)
 
-            self.assertEqual(str(err.exception), "This is non primitive json string")
+            parse_json('{"fadjj": "jfadh hafjkhds hafjgfhjd", "fjdhjs": {"dhsj": "fjdsk fsvjh sf  sfdf"}}',
+                       func, required_fields=['fadjj', 'fjdhjs'], keywords=['jfadh', 'fjdsk'])
+            self.assertEqual(func.mock_calls, [mock.call('jfadh', 'fadjj')])
 
             with self.assertRaises(ValueError) as err:
-                parse_json('{"fadjj": "jfadh hafjkhds hafjgfhjd", "fjdhjs": {"dhsj": "fjdsk fsvjh sf  sfdf"}}',
-                           func, required_fields=['a', 'b', 'c'], keywords=['a', 'b', 'c'])
+                parse_json('["jfadh", "hafjkhds", "hafjgfhjd"]', func, required_fields=['a', 'b', 'c'],
+                           keywords=['a', 'b', 'c'])
+
+            self.assertEqual(str(err.exception), "JSON document must be an object")
 
-            self.assertEqual(str(err.exception), "This is non primitive json string")
+    def test_parse_json_with_nested_fields(self):
+        json_str = json.dumps({
+            "user": {"bio": "word1 word2", "name": "word1", "address": {"city": "word2 word3"}},
+            "text": "word3 word1",
+            "user.bio": "word2",
+            "meta": {"user": {"bio": "word1"}},
+        })
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json(json_str, func, required_fields=["user.bio", "user.address.city", "text", "meta"],
+                       keywords=["word1", "word2", "word3"])
+            self.assertEqual(func.mock_calls, [mock.call("word1", "user.bio"), mock.call("word2", "user.bio"),
+                                               mock.call("word2", "user.address.city"),
+                                               mock.call("word3", "user.address.city"),
+                                               mock.call("word1", "text"), mock.call("word3", "text"),
+                                               mock.call("word2", "user.bio")])
+
+    def test_parse_json_walks_only_requested_paths(self):
+        class Document(dict):
+            def items(self):
+                visited.append(tuple(self.keys()))
+                return super().items()
+
+        visited = []
+        json_doc = Document(user=Document(bio="word1", other=Document(deep=Document(x="word1"))),
+                            skipped=Document(bio="word1"))
+        hits = JsonKeywordFilter(["user.bio"], ["word1"]).match(json_doc)
+
+        self.assertEqual(hits, [("word1", "user.bio")])
+        self.assertEqual(visited, [("user", "skipped"), ("bio", "other")])
 
     def test_with_non_string_keywords_or_required_fields(self):
         with mock.patch('json_filter.keyword_callback') as func:
@@ -167,3 +205,324 @@ class TestParseJson(unittest.TestCase):
 
             with self.assertRaises(TypeError):
                 parse_json(self.json_string, func, required_fields=['a', 'b', 'c'], keywords=["hf", 2, 3])
+
+
+class TestParseJsonStream(unittest.TestCase):
+    def setUp(self):
+        self.documents = [
+            {"key1": "word1 word2", "key2": "word2 word3"},
+            {"key1": "word3", "key3": "word1 word2"},
+            {"key2": "слово word1", "key1": "word2 word1"},
+        ]
+        self.ndjson = "\n".join(json.dumps(doc, ensure_ascii=False) for doc in self.documents) + "\n"
+        self.required_fields = ["key1", "key2"]
+        self.keywords = ["word1", "word2", "слово"]
+
+    def _expected_calls(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            for doc in self.documents:
+                parse_json(json.dumps(doc), func, self.required_fields, self.keywords)
+            return func.mock_calls
+
+    def test_parse_json_stream_binary_file(self):
+        expected = self._expected_calls()
+        for chunk_size in [1, 5, 64, 1 << 20]:
+            with mock.patch('json_filter.keyword_callback') as func:
+                source = io.BytesIO(self.ndjson.encode('utf-8'))
+                parse_json_stream(source, func, self.required_fields, self.keywords, chunk_size=chunk_size)
+                self.assertEqual(func.mock_calls, expected)
+
+    def test_parse_json_stream_text_file(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json_stream(io.StringIO(self.ndjson), func, self.required_fields, self.keywords, chunk_size=7)
+            self.assertEqual(func.mock_calls, self._expected_calls())
+
+    def test_parse_json_stream_iterable(self):
+        data = self.ndjson.encode('utf-8')
+        chunks = (data[i:i + 3] for i in range(0, len(data), 3))
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json_stream(chunks, func, self.required_fields, self.keywords)
+            self.assertEqual(func.mock_calls, self._expected_calls())
+
+    def test_parse_json_stream_blank_lines_and_no_trailing_newline(self):
+        source = io.BytesIO(b'\n{"key1": "word1"}\n\n  \n{"key1": "word2"}')
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json_stream(source, func, self.required_fields, self.keywords)
+            self.assertEqual(func.mock_calls, [mock.call("word1", "key1"), mock.call("word2", "key1")])
+
+    def test_parse_json_stream_is_lazy(self):
+        read = []
+
+        def chunks():
+            for doc in self.documents:
+                read.append(doc)
+                yield (json.dumps(doc) + "\n").encode('utf-8')
+
+        def callback(word, field):
+            raise KeyError(word)
+
+        with self.assertRaises(KeyError):
+            parse_json_stream(chunks(), callback, self.required_fields, self.keywords)
+        self.assertEqual(len(read), 1)
+
+    def test_parse_json_stream_none_parameters(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json_stream(io.BytesIO(self.ndjson.encode('utf-8')), func, self.required_fields)
+            self.assertEqual(func.call_count, 0)
+
+    def test_parse_json_stream_wrong_params(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            with self.assertRaises(TypeError):
+                parse_json_stream(self.ndjson, func, self.required_fields, self.keywords)
+
+            with self.assertRaises(TypeError):
+                parse_json_stream([1, 2], func, self.required_fields, self.keywords)
+
+            with self.assertRaises(TypeError):
+                parse_json_stream(io.StringIO(self.ndjson), 123, self.required_fields, self.keywords)
+
+            with self.assertRaises(ValueError):
+                parse_json_stream(io.StringIO(self.ndjson), func, self.required_fields, self.keywords, chunk_size=0)
+
+            with self.assertRaises(ValueError):
+                parse_json_stream(io.StringIO('{"a": "b"}\nnot json\n'), func, self.required_fields, self.keywords)
+
+
+class TestJsonKeywordFilter(unittest.TestCase):
+    def setUp(self):
+        self.json_filter = JsonKeywordFilter(["key1", "key2"], ["word2", "word1", "word3"])
+
+    def test_match(self):
+        hits = self.json_filter.match({"key1": "word1 word2 word1", "key3": "word1", "key2": "word3 word4"})
+        self.assertEqual(hits, [("word2", "key1"), ("word1", "key1"), ("word3", "key2")])
+
+        self.assertEqual(self.json_filter.match({}), [])
+        self.assertEqual(self.json_filter.match({"key3": "word1"}), [])
+
+    def test_parse_same_calls_as_parse_json(self):
+        json_str = '{"key1": "word1 word2", "key2": "word2 word3", "key3": "word1 word3"}'
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json(json_str, func, required_fields=["key1", "key2"], keywords=["word2", "word1", "word3"])
+            expected = func.mock_calls
+
+        with mock.patch('json_filter.keyword_callback') as func:
+            for _ in range(3):
+                self.json_filter.parse(json_str, func)
+            self.assertEqual(func.mock_calls, expected * 3)
+
+    def test_parse_wrong_params(self):
+        with self.assertRaises(TypeError):
+            JsonKeywordFilter("key1", ["word1"])
+
+        with self.assertRaises(TypeError):
+            JsonKeywordFilter(["key1"], ["word1", 2])
+
+        with self.assertRaises(TypeError):
+            self.json_filter.parse(b'{"key1": "word1"}', keyword_callback)
+
+        with self.assertRaises(TypeError):
+            self.json_filter.parse('{"key1": "word1"}', 123)
+
+        with self.assertRaises(ValueError) as err:
+            self.json_filter.parse('"word1"', keyword_callback)
+
+        self.assertEqual(str(err.exception), "JSON document must be an object")
+
+
+class TestBatchCallback(unittest.TestCase):
+    def setUp(self):
+        self.json_str = '{"key1": "word1 word2", "key2": "word2 word3", "key3": "word1 word3"}'
+        self.required_fields = ["key1", "key2"]
+        self.keywords = ["word2", "word1"]
+        self.hits = [("word2", "key1"), ("word1", "key1"), ("word2", "key2")]
+
+    def test_parse_json_batch_callback(self):
+        batch = mock.Mock()
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json(self.json_str, func, self.required_fields, self.keywords, batch_callback=batch)
+            self.assertEqual(func.call_count, 0)
+
+        parse_json(self.json_str, None, self.required_fields, self.keywords, batch_callback=batch)
+        self.assertEqual(batch.mock_calls, [mock.call(self.hits)] * 2)
+
+    def test_parse_json_batch_callback_without_hits(self):
+        batch = mock.Mock()
+        parse_json('{"key3": "word1"}', None, self.required_fields, self.keywords, batch_callback=batch)
+        self.assertEqual(batch.call_count, 0)
+
+    def test_parse_json_stream_batch_size(self):
+        source = "\n".join([self.json_str, '{"key3": "word1"}', '{"key1": "word1"}'] * 2)
+
+        for batch_size, expected in [
+            (1, [self.hits, [("word1", "key1")]] * 2),
+            (2, [self.hits, [("word1", "key1")] + self.hits, [("word1", "key1")]]),
+            (10, [(self.hits + [("word1", "key1")]) * 2]),
+        ]:
+            batch = mock.Mock()
+            parse_json_stream(io.StringIO(source), None, self.required_fields, self.keywords,
+                              batch_callback=batch, batch_size=batch_size)
+            self.assertEqual(batch.mock_calls, [mock.call(hits) for hits in expected])
+
+    def test_batch_callback_wrong_params(self):
+        with self.assertRaises(TypeError):
+            parse_json(self.json_str, None, self.required_fields, self.keywords)
+
+        with self.assertRaises(TypeError):
+            parse_json(self.json_str, keyword_callback, self.required_fields, self.keywords, batch_callback=123)
+
+        with self.assertRaises(ValueError):
+            parse_json_stream(io.StringIO(self.json_str), None, self.required_fields, self.keywords,
+                              batch_callback=mock.Mock(), batch_size=0)
+
+
+class TestParseJsonParallel(unittest.TestCase):
+    def setUp(self):
+        self.json_strs = [json.dumps({"key1": f"word{i % 3} word{i % 5}", "key2": f"word{i % 7}", "key3": "word1"})
+                          for i in range(50)]
+        self.required_fields = ["key1", "key2"]
+        self.keywords = ["word1", "word2", "word4"]
+
+    def _expected_calls(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            for json_str in self.json_strs:
+                parse_json(json_str, func, self.required_fields, self.keywords)
+            return func.mock_calls
+
+    def test_parse_json_parallel_preserves_order(self):
+        expected = self._expected_calls()
+        for chunk_size in [1, 7, 1000]:
+            with mock.patch('json_filter.keyword_callback') as func:
+                parse_json_parallel(iter(self.json_strs), func, self.required_fields, self.keywords,
+                                    workers=2, chunk_size=chunk_size)
+                self.assertEqual(func.mock_calls, expected)
+
+    def test_parse_json_parallel_batch_callback(self):
+        batch = mock.Mock()
+        parse_json_parallel(self.json_strs, None, self.required_fields, self.keywords, workers=2, chunk_size=4,
+                            batch_callback=batch)
+
+        hits = [call.args for call in self._expected_calls()]
+        self.assertEqual([hit for call in batch.mock_calls for hit in call.args[0]], hits)
+
+    def test_parse_json_parallel_none_parameters(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            parse_json_parallel(self.json_strs, func, self.required_fields)
+            self.assertEqual(func.call_count, 0)
+
+    def test_parse_json_parallel_wrong_params(self):
+        with mock.patch('json_filter.keyword_callback') as func:
+            with self.assertRaises(TypeError):
+                parse_json_parallel(self.json_strs[0], func, self.required_fields, self.keywords)
+
+            with self.assertRaises(TypeError):
+                parse_json_parallel(self.json_strs, func, "key1", self.keywords)
+
+            with self.assertRaises(ValueError):
+                parse_json_parallel(self.json_strs, func, self.required_fields, self.keywords, chunk_size=0)
+
+            with self.assertRaises(ValueError):
+                parse_json_parallel(self.json_strs, func, self.required_fields, self.keywords, workers=0)
+
+            with self.assertRaises(TypeError):
+                parse_json_parallel(self.json_strs, func, self.required_fields, self.keywords, workers=2.0)
+
+            with self.assertRaises(TypeError):
+                parse_json_parallel([123], func, self.required_fields, self.keywords, workers=1)
+
+            with self.assertRaises(ValueError):
+                parse_json_parallel(['["word1"]'], func, self.required_fields, self.keywords, workers=1)
+
+
+class TestJsonBackends(unittest.TestCase):
+    def setUp(self):
+        self.json_strs = [
+            '{"key1": "word1 word2", "key2": "word3", "key3": "word1"}',
+            '{  "key1"  :  "word2"  ,  "count": 12.5, "key2": "word1 word3"}',
+            '{"key1": "word1 \\"quoted\\" word2", "key2": "line\\nword3"}',
+            '{"key1": {"nested": "word1"}, "key2": ["word1"], "key3": "word3"}',
+        ]
+        self.required_fields = ["key1", "key2", "key1.nested"]
+        self.keywords = ["word1", "word2", "word3"]
+
+    def test_backends_give_same_hits(self):
+        expected = [JsonKeywordFilter(self.required_fields, self.keywords, 'json').match(json.loads(json_str))
+                    for json_str in self.json_strs]
+
+        for backend in JSON_BACKENDS:
+            json_filter = JsonKeywordFilter(self.required_fields, self.keywords, backend)
+            for json_str, hits in zip(self.json_strs, expected):
+                batch = mock.Mock()
+                json_filter.parse(json_str, None, batch_callback=batch)
+                self.assertEqual(batch.mock_calls, [mock.call(hits)], backend)
+
+    def test_backends_reject_invalid_json(self):
+        for backend in JSON_BACKENDS:
+            with self.assertRaises(ValueError):
+                parse_json('{"key1": "word1", "key2"}', keyword_callback, self.required_fields, self.keywords,
+                           backend=backend)
+
+    def test_cjson_backend_falls_back_to_stdlib(self):
+        with mock.patch.object(json_filter, 'cjson') as cjson:
+            cjson.loads.return_value = {"key1": "flat"}
+            self.assertEqual(json_filter._cjson_loads('{"key1": "flat"}'), {"key1": "flat"})
+            self.assertEqual(json_filter._cjson_loads(b'{"key1": "flat"}'), {"key1": "flat"})
+
+            self.assertEqual(json_filter._cjson_loads('{"key1": "a\\\\nb"}'), {"key1": "a\\nb"})
+            self.assertEqual(cjson.loads.call_count, 2)
+
+            cjson.loads.side_effect = TypeError("Expected number value")
+            self.assertEqual(json_filter._cjson_loads('{"key1": {"key2": "v"}}'), {"key1": {"key2": "v"}})
+
+    def test_backends_accept_stdlib_json(self):
+        json_strs = ['{"key1": NaN, "key2": "word1"}', '{"key1": Infinity, "key2": "word2"}',
+                     '{"key1": "\\ud800", "key2": "word3"}']
+
+        for backend in JSON_BACKENDS:
+            for json_str in json_strs:
+                batch = mock.Mock()
+                JsonKeywordFilter(self.required_fields, self.keywords, backend).parse(json_str, None, batch)
+                self.assertEqual(batch.mock_calls, [mock.call([(json.loads(json_str)["key2"], "key2")])], backend)
+
+    def test_orjson_backend_falls_back_to_stdlib(self):
+        if json_filter.orjson is None:
+            self.skipTest('orjson is not installed')
+
+        self.assertTrue(math.isnan(json_filter._orjson_loads('{"key1": NaN}')["key1"]))
+        self.assertEqual(json_filter._orjson_loads(b'{"key1": "word1"}'), {"key1": "word1"})
+
+        with self.assertRaises(ValueError):
+            json_filter._orjson_loads('{"key1": "word1",}')
+
+    def test_real_cjson_module(self):
+        # The extension is built in place by `make compile` or `python setup.py build_ext --inplace` in 10/.
+        sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '10'))
+        try:
+            import cjson
+        except ImportError:
+            self.skipTest('cjson extension is not built')
+        finally:
+            sys.path.pop(0)
+
+        with mock.patch.object(json_filter, 'cjson', cjson):
+            for json_str in ['{"key1": "word1", "count": -12.5e3, "key2": "word2"}', '{}',
+                             '{"key1": "a\\nb", "key2": 0}', '{"key1": {"nested": "word1"}}']:
+                self.assertEqual(json_filter._cjson_loads(json_str), json.loads(json_str))
+
+            for json_str in ['{"key1": "word1",}', '{"key1": 0x10}', '{"key1": 01}', '{"key1": 1.}',
+                             '{"key1": -}', '{"key1": .5}', '{"key1": +1}', '{"key1": "a\tb"}',
+                             '{"key1": "word1", "key2"}', '{"key1": "word1"} x']:
+                with self.assertRaises(ValueError, msg=json_str):
+                    json_filter._cjson_loads(json_str)
+
+    def test_get_json_backend(self):
+        self.assertIs(get_json_backend('json'), json.loads)
+        self.assertIn(get_json_backend(), JSON_BACKENDS.values())
+
+        with mock.patch.dict(json_filter.JSON_BACKENDS, {'json': json.loads}, clear=True):
+            self.assertIs(get_json_backend(), json.loads)
+
+        with self.assertRaises(ValueError):
+            get_json_backend('simdjson')
+
+        with self.assertRaises(ValueError):
+            JsonKeywordFilter(self.required_fields, self.keywords, 'simdjson')
@@ -1,8 +1,126 @@
 from __future__ import annotations
-from typing import Union, List, Tuple
+import mmap
+import struct
+import sys
+from array import array
+from itertools import chain, islice, repeat, starmap, zip_longest
+from operator import add, sub
+from typing import Union, List, Tuple, Iterable, Iterator, Callable, Optional, Sequence, MutableSequence, BinaryIO
+
+try:
+    import numpy as np
+except ImportError:
+    np = None
+
+
+def _elementwise(op: Callable, left: Sequence, right: Sequence) -> Iterable:
+    if len(left) == len(right):
+        return map(op, left, right)
+
+    return starmap(op, zip_longest(left, right, fillvalue=0))
+
+
+def _array_inplace(op: Callable, target: array, other: array, common: int) -> None:
+    # The NumPy views must be released before the caller resizes the target array.
+    view = np.frombuffer(target, dtype=np.float64)[:common]
+    np_op = np.add if op is add else np.subtract
+    np_op(view, np.frombuffer(other, dtype=np.float64)[:common], out=view)
+
+
+def _array_elementwise(cls: type, op: Callable, left: Sequence, right: Sequence) -> array:
+    # The result is created as an instance of cls, an array subclass, so it is not copied again.
+    if np is None or not (isinstance(left, array) and isinstance(right, array)):
+        return array.__new__(cls, 'd', _elementwise(op, left, right))
+
+    # Both operands are contiguous doubles: NumPy views them without copying and
+    # writes straight into the buffer of the zero-padded result.
+    left_view = np.frombuffer(left, dtype=np.float64)
+    right_view = np.frombuffer(right, dtype=np.float64)
+
+    result = array.__new__(cls, 'd', bytes(8 * max(len(left), len(right))))
+    out = np.frombuffer(result, dtype=np.float64)
+    out[:len(left)] = left_view
+    np_op = np.add if op is add else np.subtract
+    np_op(out[:len(right)], right_view, out=out[:len(right)])
+
+    return result
+
+
+def _sum_of(values: Union[CustomList, CustomArray, CustomListExpr]) -> Union[int, float]:
+    if isinstance(values, (CustomList, CustomListExpr)):
+        return values._total()
+
+    return sum(values)
+
+
+# Binary format: magic, format version, payload typecode ('q' for int64, 'd' for float64), two padding
+# bytes and the element count, followed by the little-endian payload. The header is 16 bytes long,
+# so the payload stays 8-byte aligned in a memory-mapped file.
+_HEADER = struct.Struct('<4sBc2xQ')
+_MAGIC = b'CLST'
+_VERSION = 1
+
+
+def _pack(values: List[Union[int, float]]) -> Tuple[bytes, array]:
+    typecode = 'q' if all(isinstance(elem, int) for elem in values) else 'd'
+    payload = array(typecode)
+    # fromlist() copies a list in one pass, the constructor goes through the generic iterator path.
+    kind = 'int64' if typecode == 'q' else 'float64'
+    try:
+        payload.fromlist(values)
+    except OverflowError:
+        # Converting such ints to float64 instead would silently change their values.
+        raise ValueError(f'CustomList elements do not fit into {kind} and cannot be serialized') from None
+
+    # Next to floats, ints above 2 ** 53 are rounded by the float64 payload, so they are rejected too.
+    if typecode == 'd' and any(isinstance(elem, int) and converted != elem for elem, converted in zip(values, payload)):
+        raise ValueError(f'CustomList elements do not fit into {kind} and cannot be serialized')
+
+    if sys.byteorder == 'big':
+        payload.byteswap()
+
+    return _HEADER.pack(_MAGIC, _VERSION, typecode.encode('ascii'), len(payload)), payload
+
+
+def _unpack_header(data: Union[bytes, memoryview, mmap.mmap]) -> Tuple[str, int]:
+    if len(data) < _HEADER.size:
+        raise ValueError('Data is too short to contain a CustomList header')
+
+    magic, version, typecode, count = _HEADER.unpack_from(data)
+    if magic != _MAGIC:
+        raise ValueError('Data does not contain a serialized CustomList')
+
+    if version != _VERSION:
+        raise ValueError(f'Unsupported CustomList format version: {version}')
+
+    if typecode not in (b'q', b'd'):
+        raise ValueError(f'Unsupported CustomList element type: {typecode!r}')
+
+    if len(data) != _HEADER.size + 8 * count:
+        raise ValueError('CustomList payload size does not match the header')
+
+    return typecode.decode('ascii'), count
+
+
+def _map_file(file: BinaryIO) -> mmap.mmap:
+    try:
+        return mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+    except ValueError:
+        # Empty files cannot be memory-mapped.
+        raise ValueError('Data is too short to contain a CustomList header')
+
+
+def _check_elements(values: Iterable) -> None:
+    if not all(isinstance(elem, (int, float)) for elem in values):
+        raise TypeError('CustomList elements must be of type int or float')
 
 
 class CustomList(list):
+    # Running sum of the elements, None when it has to be recomputed. Updates are applied
+    # incrementally only while the sum is an exact int; any float change invalidates it, since
+    # sum() may round differently than a running total (it is compensated since Python 3.12).
+    _sum = None
+
     def __init__(self, arg: Union[List[Union[int, float]], Tuple[Union[int, float], ...]]) -> None:
         if not isinstance(arg, (list, tuple)):
             raise TypeError('CustomList can be created only based on a list or a tuple')
@@ -12,66 +130,205 @@ class CustomList(list):
             else:
                 raise TypeError('CustomList elements must be of type int or float')
 
-    def __add__(self, other: Union[CustomList, List]) -> CustomList:
-        if not isinstance(other, (CustomList, list)):
-            raise TypeError('Only the CustomList and default list can be added to the CustomList')
+    def _total(self) -> Union[int, float]:
+        if self._sum is None:
+            self._sum = sum(self)
 
-        if not all(isinstance(elem, (int, float)) for elem in other):
-            raise TypeError('Only default list with elements of int or float type can be added to the CustomList')
-
-        if len(self) < len(other):
-            new_list = list(self)
-            new_list.extend([0] * (len(other) - len(self)))
-            result = CustomList([new_list[i] + other[i] for i in range(len(other))])
-        elif len(self) > len(other):
-            new_list = list(other)
-            new_list.extend([0] * (len(self) - len(other)))
-            result = CustomList([new_list[i] + self[i] for i in range(len(self))])
+        return self._sum
+
+    def _replaced(self, removed: List[Union[int, float]], added: List[Union[int, float]]) -> None:
+        if isinstance(self._sum, int) and all(isinstance(elem, int) for elem in removed) and \
+           all(isinstance(elem, int) for elem in added):
+            self._sum += sum(added) - sum(removed)
         else:
-            result = CustomList([other[i] + self[i] for i in range(len(self))])
+            self._sum = None
 
-        return result
+    def append(self, value: Union[int, float]) -> None:
+        _check_elements([value])
+        super().append(value)
+        self._replaced([], [value])
 
-    def __radd__(self, other: Union[CustomList, List]) -> CustomList:
-        return self + other
+    def extend(self, values: Iterable[Union[int, float]]) -> None:
+        values = list(values)
+        _check_elements(values)
+        super().extend(values)
+        self._replaced([], values)
 
-    def __sub__(self, other: Union[CustomList, List]) -> CustomList:
-        if not isinstance(other, (CustomList, list)):
-            raise TypeError('Only the CustomList and default list can be subtracted with the CustomList')
+    def insert(self, index: int, value: Union[int, float]) -> None:
+        _check_elements([value])
+        super().insert(index, value)
+        self._replaced([], [value])
 
-        if not all(isinstance(elem, (int, float)) for elem in other):
-            raise TypeError('Only default list with elements of int or float type can be subtracted with the CustomList')
-
-        if len(self) < len(other):
-            new_list = list(self)
-            new_list.extend([0] * (len(other) - len(self)))
-            result = CustomList([new_list[i] - other[i] for i in range(len(other))])
-        elif len(self) > len(other):
-            new_list = list(other)
-            new_list.extend([0] * (len(self) - len(other)))
-            result = CustomList([self[i] - new_list[i] for i in range(len(self))])
+    def pop(self, index: int = -1) -> Union[int, float]:
+        value = super().pop(index)
+        self._replaced([value], [])
+        return value
+
+    def remove(self, value: Union[int, float]) -> None:
+        del self[self.index(value)]
+
+    def clear(self) -> None:
+        super().clear()
+        self._sum = 0
+
+    def sort(self, *args, **kwargs) -> None:
+        super().sort(*args, **kwargs)
+        self._replaced([], [])
+
+    def reverse(self) -> None:
+        super().reverse()
+        self._replaced([], [])
+
+    def __setitem__(self, index: Union[int, slice], value) -> None:
+        if isinstance(index, slice):
+            added = list(value)
+            removed = super().__getitem__(index)
         else:
-            result = CustomList([self[i] - other[i] for i in range(len(self))])
+            added = [value]
+            removed = [super().__getitem__(index)]
+
+        _check_elements(added)
+        super().__setitem__(index, added if isinstance(index, slice) else value)
+        self._replaced(removed, added)
+
+    def __delitem__(self, index: Union[int, slice]) -> None:
+        removed = super().__getitem__(index)
+        super().__delitem__(index)
+        self._replaced(removed if isinstance(index, slice) else [removed], [])
+
+    def _inplace(self, op: Callable, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        common = min(len(self), len(other))
+        super().__setitem__(slice(0, common), map(op, self, other))
+        if len(other) > common:
+            super().extend(map(op, repeat(0, len(other) - common), islice(other, common, None)))
+
+        self._sum = None
+        return self
 
+    def __iadd__(self, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        self._check_operand(other, 'added to')
+        return self._inplace(add, other)
+
+    def __isub__(self, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        self._check_operand(other, 'subtracted with')
+        return self._inplace(sub, other)
+
+    def view(self, start: Optional[int] = None, stop: Optional[int] = None,
+             step: Optional[int] = None) -> CustomListView:
+        return CustomListView(self, slice(start, stop, step))
+
+    def to_bytes(self) -> bytes:
+        header, payload = _pack(self)
+        return b''.join((header, payload))
+
+    @classmethod
+    def from_bytes(cls, data: Union[bytes, bytearray, memoryview]) -> CustomList:
+        typecode, _ = _unpack_header(data)
+
+        payload = array(typecode)
+        payload.frombytes(memoryview(data)[_HEADER.size:])
+        if sys.byteorder == 'big':
+            payload.byteswap()
+
+        return cls._from_trusted(payload)
+
+    def dump(self, file: Union[BinaryIO, str]) -> None:
+        header, payload = _pack(self)
+
+        if isinstance(file, str):
+            with open(file, 'wb') as f:
+                f.write(header)
+                f.write(payload)
+        else:
+            file.write(header)
+            file.write(payload)
+
+    @classmethod
+    def load(cls, file: Union[BinaryIO, str], mmap: bool = False) -> Union[CustomList, CustomListView]:
+        # With mmap=True nothing is parsed: the result is a read-only view over the mapped file,
+        # which is paged in lazily and stays mapped while the view is alive.
+        if not mmap or sys.byteorder == 'big':
+            if isinstance(file, str):
+                with open(file, 'rb') as f:
+                    return cls.from_bytes(f.read())
+
+            return cls.from_bytes(file.read())
+
+        if isinstance(file, str):
+            with open(file, 'rb') as f:
+                data = _map_file(f)
+        else:
+            data = _map_file(file)
+
+        typecode, _ = _unpack_header(data)
+        return CustomListView(memoryview(data)[_HEADER.size:].cast(typecode))
+
+    def lazy(self) -> CustomListExpr:
+        return CustomListExpr((self,), ())
+
+    def __imul__(self, count: int) -> CustomList:
+        super().__imul__(count)
+        self._sum = self._sum * max(count, 0) if isinstance(self._sum, int) else None
+        return self
+
+    def __reduce__(self):
+        # The cached sum is derived state, it must not be restored next to re-appended elements.
+        return self.__class__, (list(self),)
+
+    @classmethod
+    def _from_trusted(cls, values: Iterable[Union[int, float]]) -> CustomList:
+        # Results of element-wise arithmetic are numeric by construction, so the
+        # per-element type check of __init__ is skipped.
+        result = cls.__new__(cls)
+        list.extend(result, values)
         return result
 
+    @staticmethod
+    def _check_operand(other: Union[CustomList, CustomArray, List], action: str) -> None:
+        if isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            return
+
+        if not isinstance(other, list):
+            raise TypeError(f'Only the CustomList and default list can be {action} the CustomList')
+
+        if not all(isinstance(elem, (int, float)) for elem in other):
+            raise TypeError(f'Only default list with elements of int or float type can be {action} the CustomList')
+
+    def __add__(self, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        if isinstance(other, CustomListExpr):
+            return NotImplemented
+
+        self._check_operand(other, 'added to')
+        return CustomList._from_trusted(_elementwise(add, self, other))
+
+    def __radd__(self, other: Union[CustomList, List]) -> CustomList:
+        return self + other
+
+    def __sub__(self, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        if isinstance(other, CustomListExpr):
+            return NotImplemented
+
+        self._check_operand(other, 'subtracted with')
+        return CustomList._from_trusted(_elementwise(sub, self, other))
+
     def __rsub__(self, other: Union[CustomList, List]) -> CustomList:
-        return CustomList([(-1) * elem for elem in self - other])
+        self._check_operand(other, 'subtracted with')
+        return CustomList._from_trusted(_elementwise(sub, other, self))
 
-    def __eq__(self, other: CustomList) -> bool:
-        if not isinstance(other, CustomList):
+    def __eq__(self, other: Union[CustomList, CustomArray]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
             raise TypeError('Only the CustomList can be compared')
 
-        return sum(self) == sum(other)
+        return self._total() == _sum_of(other)
 
     def __ne__(self, other: CustomList) -> bool:
         return not self == other
 
-    def __lt__(self, other: CustomList) -> bool:
-        if not isinstance(other, CustomList):
+    def __lt__(self, other: Union[CustomList, CustomArray]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
             raise TypeError('Only the CustomList can be compared')
 
-        return sum(self) < sum(other)
+        return self._total() < _sum_of(other)
 
     def __ge__(self, other: CustomList) -> bool:
         return not self < other
@@ -83,4 +340,310 @@ class CustomList(list):
         return not self > other
 
     def __str__(self) -> str:
-        return f'{super().__str__()}, {sum(self)}'
+        return f'{super().__str__()}, {self._total()}'
+
+
+# Same semantics as CustomList, but elements are stored unboxed in a contiguous array of
+# C doubles (8 bytes each instead of a pointer plus a number object), so ints become floats.
+class CustomArray(array):
+    def __new__(cls, arg: Union[List[Union[int, float]], Tuple[Union[int, float], ...], array] = ()) -> CustomArray:
+        if isinstance(arg, array):
+            if arg.typecode not in 'bBhHiIlLqQfd':
+                raise TypeError('CustomArray elements must be of type int or float')
+        elif not isinstance(arg, (list, tuple)):
+            raise TypeError('CustomArray can be created only based on a list, a tuple or an array')
+        elif not all(isinstance(elem, (int, float)) for elem in arg):
+            raise TypeError('CustomArray elements must be of type int or float')
+
+        return super().__new__(cls, 'd', arg)
+
+    @staticmethod
+    def _check_operand(other: Union[CustomList, CustomArray, List], action: str) -> None:
+        if not isinstance(other, (CustomArray, CustomList, CustomListView, CustomListExpr, list)):
+            raise TypeError(f'Only the CustomArray, CustomList and default list can be {action} the CustomArray')
+
+        if isinstance(other, list) and not all(isinstance(elem, (int, float)) for elem in other):
+            raise TypeError(f'Only default list with elements of int or float type can be {action} the CustomArray')
+
+    def __add__(self, other: Union[CustomList, CustomArray, List]) -> CustomArray:
+        self._check_operand(other, 'added to')
+        return _array_elementwise(type(self), add, self, other)
+
+    def __radd__(self, other: Union[CustomList, List]) -> CustomArray:
+        return self + other
+
+    def __sub__(self, other: Union[CustomList, CustomArray, List]) -> CustomArray:
+        self._check_operand(other, 'subtracted with')
+        return _array_elementwise(type(self), sub, self, other)
+
+    def __rsub__(self, other: Union[CustomList, List]) -> CustomArray:
+        self._check_operand(other, 'subtracted with')
+        return _array_elementwise(type(self), sub, other, self)
+
+    def _inplace(self, op: Callable, other: Union[CustomList, CustomArray, List]) -> CustomArray:
+        common = min(len(self), len(other))
+        if np is not None and isinstance(other, array):
+            _array_inplace(op, self, other, common)
+        else:
+            self[:common] = array('d', map(op, self, other))
+
+        if len(other) > common:
+            self.extend(map(op, repeat(0, len(other) - common), islice(other, common, None)))
+
+        return self
+
+    def __iadd__(self, other: Union[CustomList, CustomArray, List]) -> CustomArray:
+        self._check_operand(other, 'added to')
+        return self._inplace(add, other)
+
+    def __isub__(self, other: Union[CustomList, CustomArray, List]) -> CustomArray:
+        self._check_operand(other, 'subtracted with')
+        return self._inplace(sub, other)
+
+    def view(self, start: Optional[int] = None, stop: Optional[int] = None,
+             step: Optional[int] = None) -> CustomListView:
+        return CustomListView(self, slice(start, stop, step))
+
+    def __eq__(self, other: Union[CustomList, CustomArray]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            raise TypeError('Only the CustomList can be compared')
+
+        return sum(self) == _sum_of(other)
+
+    def __ne__(self, other: Union[CustomList, CustomArray]) -> bool:
+        return not self == other
+
+    def __lt__(self, other: Union[CustomList, CustomArray]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            raise TypeError('Only the CustomList can be compared')
+
+        return sum(self) < _sum_of(other)
+
+    def __ge__(self, other: Union[CustomList, CustomArray]) -> bool:
+        return not self < other
+
+    def __gt__(self, other: Union[CustomList, CustomArray]) -> bool:
+        return (self >= other) and (self != other)
+
+    def __le__(self, other: Union[CustomList, CustomArray]) -> bool:
+        return not self > other
+
+    def __str__(self) -> str:
+        return f'{self.tolist()}, {sum(self)}'
+
+
+# A window over the storage of a CustomList, a CustomArray or any other mutable sequence of numbers.
+# Nothing is copied: reads and writes go straight to the parent, which therefore must not be
+# resized while the view is in use.
+class CustomListView:
+    __slots__ = ('base', 'indices')
+
+    def __init__(self, base: MutableSequence[Union[int, float]], index: slice = slice(None)) -> None:
+        if not isinstance(index, slice):
+            raise TypeError('CustomListView can be created only based on a slice')
+
+        self.base = base
+        self.indices = range(len(base))[index]
+
+    def __len__(self) -> int:
+        return len(self.indices)
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        return map(self.base.__getitem__, self.indices)
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, float, CustomListView]:
+        if isinstance(index, slice):
+            view = CustomListView.__new__(CustomListView)
+            view.base = self.base
+            view.indices = self.indices[index]
+            return view
+
+        return self.base[self.indices[index]]
+
+    def __setitem__(self, index: Union[int, slice], value) -> None:
+        if isinstance(index, slice):
+            values = list(value)
+            indices = self.indices[index]
+            if len(values) != len(indices):
+                raise ValueError('CustomListView cannot change the size of its parent')
+
+            _check_elements(values)
+            for i, elem in zip(indices, values):
+                self.base[i] = elem
+        else:
+            _check_elements([value])
+            self.base[self.indices[index]] = value
+
+    def tolist(self) -> List[Union[int, float]]:
+        return list(self)
+
+    def _inplace(self, op: Callable, other: Union[CustomList, CustomArray, List]) -> CustomListView:
+        if len(other) > len(self):
+            raise ValueError('CustomListView cannot change the size of its parent')
+
+        base = self.base
+        for i, elem in zip(self.indices, other):
+            base[i] = op(base[i], elem)
+
+        return self
+
+    def __add__(self, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        CustomList._check_operand(other, 'added to')
+        return CustomList._from_trusted(_elementwise(add, self, other))
+
+    def __radd__(self, other: Union[CustomList, List]) -> CustomList:
+        return self + other
+
+    def __sub__(self, other: Union[CustomList, CustomArray, List]) -> CustomList:
+        CustomList._check_operand(other, 'subtracted with')
+        return CustomList._from_trusted(_elementwise(sub, self, other))
+
+    def __rsub__(self, other: Union[CustomList, List]) -> CustomList:
+        CustomList._check_operand(other, 'subtracted with')
+        return CustomList._from_trusted(_elementwise(sub, other, self))
+
+    def __iadd__(self, other: Union[CustomList, CustomArray, List]) -> CustomListView:
+        CustomList._check_operand(other, 'added to')
+        return self._inplace(add, other)
+
+    def __isub__(self, other: Union[CustomList, CustomArray, List]) -> CustomListView:
+        CustomList._check_operand(other, 'subtracted with')
+        return self._inplace(sub, other)
+
+    def __eq__(self, other: Union[CustomList, CustomArray, CustomListView]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            raise TypeError('Only the CustomList can be compared')
+
+        return sum(self) == _sum_of(other)
+
+    def __ne__(self, other: Union[CustomList, CustomArray, CustomListView]) -> bool:
+        return not self == other
+
+    def __lt__(self, other: Union[CustomList, CustomArray, CustomListView]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            raise TypeError('Only the CustomList can be compared')
+
+        return sum(self) < _sum_of(other)
+
+    def __ge__(self, other: Union[CustomList, CustomArray, CustomListView]) -> bool:
+        return not self < other
+
+    def __gt__(self, other: Union[CustomList, CustomArray, CustomListView]) -> bool:
+        return (self >= other) and (self != other)
+
+    def __le__(self, other: Union[CustomList, CustomArray, CustomListView]) -> bool:
+        return not self > other
+
+    def __str__(self) -> str:
+        return f'{self.tolist()}, {sum(self)}'
+
+    def __repr__(self) -> str:
+        return f'CustomListView({self.tolist()})'
+
+
+# Deferred result of chained CustomList arithmetic, created by CustomList.lazy(). Operators only
+# record operands, the elements are computed on first access in a single pass through nested map
+# iterators, so only the final list is allocated. Comparisons use the sums of the operands and never
+# build the result at all; for floats they may differ from the sum of the result in the last bits.
+# Operands must not be modified until the expression has been evaluated.
+class CustomListExpr:
+    __slots__ = ('operands', 'ops', '_result', '_sum')
+
+    def __init__(self, operands: Tuple[Sequence[Union[int, float]], ...], ops: Tuple[Callable, ...]) -> None:
+        self.operands = operands
+        self.ops = ops
+        self._result = None
+        self._sum = None
+
+    def _chain(self, op: Callable, other: Union[CustomList, CustomArray, CustomListExpr, List],
+               action: str) -> CustomListExpr:
+        if not isinstance(other, CustomListExpr):
+            CustomList._check_operand(other, action)
+
+        if self._result is not None:
+            return CustomListExpr((self._result, other), (op,))
+
+        return CustomListExpr(self.operands + (other,), self.ops + (op,))
+
+    def evaluate(self) -> CustomList:
+        if self._result is None:
+            size = len(self)
+            values = self._padded(self.operands[0], size)
+            for op, operand in zip(self.ops, self.operands[1:]):
+                values = map(op, values, self._padded(operand, size))
+
+            self._result = CustomList._from_trusted(values)
+
+        return self._result
+
+    @staticmethod
+    def _padded(operand: Sequence[Union[int, float]], size: int) -> Iterable[Union[int, float]]:
+        if len(operand) == size:
+            return operand
+
+        return chain(operand, repeat(0, size - len(operand)))
+
+    def _total(self) -> Union[int, float]:
+        if self._sum is None:
+            total = _sum_of(self.operands[0])
+            for op, operand in zip(self.ops, self.operands[1:]):
+                total = op(total, _sum_of(operand))
+            self._sum = total
+
+        return self._sum
+
+    def __len__(self) -> int:
+        if self._result is not None:
+            return len(self._result)
+
+        return max(map(len, self.operands))
+
+    def __iter__(self) -> Iterator[Union[int, float]]:
+        return iter(self.evaluate())
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[int, float, List[Union[int, float]]]:
+        return self.evaluate()[index]
+
+    def __add__(self, other: Union[CustomList, CustomArray, CustomListExpr, List]) -> CustomListExpr:
+        return self._chain(add, other, 'added to')
+
+    def __radd__(self, other: Union[CustomList, List]) -> CustomListExpr:
+        CustomList._check_operand(other, 'added to')
+        return CustomListExpr((other, self), (add,))
+
+    def __sub__(self, other: Union[CustomList, CustomArray, CustomListExpr, List]) -> CustomListExpr:
+        return self._chain(sub, other, 'subtracted with')
+
+    def __rsub__(self, other: Union[CustomList, List]) -> CustomListExpr:
+        CustomList._check_operand(other, 'subtracted with')
+        return CustomListExpr((other, self), (sub,))
+
+    def __eq__(self, other: Union[CustomList, CustomArray, CustomListView, CustomListExpr]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            raise TypeError('Only the CustomList can be compared')
+
+        return self._total() == _sum_of(other)
+
+    def __ne__(self, other: Union[CustomList, CustomArray, CustomListView, CustomListExpr]) -> bool:
+        return not self == other
+
+    def __lt__(self, other: Union[CustomList, CustomArray, CustomListView, CustomListExpr]) -> bool:
+        if not isinstance(other, (CustomList, CustomArray, CustomListView, CustomListExpr)):
+            raise TypeError('Only the CustomList can be compared')
+
+        return self._total() < _sum_of(other)
+
+    def __ge__(self, other: Union[CustomList, CustomArray, CustomListView, CustomListExpr]) -> bool:
+        return not self < other
+
+    def __gt__(self, other: Union[CustomList, CustomArray, CustomListView, CustomListExpr]) -> bool:
+        return (self >= other) and (self != other)
+
+    def __le__(self, other: Union[CustomList, CustomArray, CustomListView, CustomListExpr]) -> bool:
+        return not self > other
+
+    def __str__(self) -> str:
+        return str(self.evaluate())
+
+    def __repr__(self) -> str:
+        return f'CustomListExpr({list(self.evaluate())})'
@@ -1,5 +1,9 @@
+import os
+import tempfile
 import unittest
-from custom_list import CustomList
+import custom_list
+from custom_list import CustomList, CustomArray, CustomListView, CustomListExpr
+from unittest import mock
 import math
 
 
@@ -877,3 +881,510 @@ class TestCustomList(unittest.TestCase):
         self.assertEqual(str(CustomList([-1, 0, 1])), '[-1, 0, 1], 0')
         self.assertEqual(str(CustomList([3.14, 2.71])), '[3.14, 2.71], 5.85')
         self.assertEqual(str(CustomList([])), '[], 0')
+
+
+class TestCustomArray(unittest.TestCase):
+    def test_custom_array_init(self):
+        custom_array = CustomArray([1, 2.5, 3])
+        self.assertEqual(list(custom_array), [1.0, 2.5, 3.0])
+        self.assertEqual(custom_array.typecode, 'd')
+        self.assertEqual(custom_array.itemsize, 8)
+        self.assertEqual(list(CustomArray((1, 2))), [1.0, 2.0])
+        self.assertEqual(list(CustomArray()), [])
+
+        with self.assertRaises(TypeError) as err:
+            CustomArray(20)
+        self.assertEqual(str(err.exception), 'CustomArray can be created only based on a list, a tuple or an array')
+
+        with self.assertRaises(TypeError) as err:
+            CustomArray([1, 'a'])
+        self.assertEqual(str(err.exception), 'CustomArray elements must be of type int or float')
+
+    def test_custom_array_add(self):
+        custom_array = CustomArray([1, 2, 3, 4])
+        for other in [CustomArray([5, 6]), CustomList([5, 6]), [5, 6]]:
+            result = custom_array + other
+            self.assertTrue(isinstance(result, CustomArray))
+            self.assertTrue(custom_eq(result, [6, 8, 3, 4]))
+
+            result = other + custom_array
+            self.assertTrue(custom_eq(result, [6, 8, 3, 4]))
+
+        self.assertTrue(isinstance([5] + custom_array, CustomArray))
+        self.assertTrue(isinstance(CustomList([5]) + custom_array, CustomList))
+        self.assertTrue(custom_eq(custom_array, [1, 2, 3, 4]))
+
+    def test_custom_array_sub(self):
+        custom_array = CustomArray([1, 2])
+        for other in [CustomArray([5, 6, 7]), CustomList([5, 6, 7]), [5, 6, 7]]:
+            self.assertTrue(custom_eq(custom_array - other, [-4, -4, -7]))
+            self.assertTrue(custom_eq(other - custom_array, [4, 4, 7]))
+
+        self.assertTrue(isinstance([5] - custom_array, CustomArray))
+        self.assertTrue(isinstance(CustomList([5]) - custom_array, CustomList))
+
+    def test_custom_array_arithmetic_invalid_type(self):
+        custom_array = CustomArray([1, 2])
+        with self.assertRaises(TypeError):
+            custom_array + 'invalid'
+
+        with self.assertRaises(TypeError):
+            'invalid' - custom_array
+
+        with self.assertRaises(TypeError):
+            custom_array + [1, 'invalid']
+
+    def test_custom_array_comparison(self):
+        self.assertTrue(CustomArray([1, 2, 3]) == CustomArray([6]))
+        self.assertTrue(CustomArray([1, 2, 3]) == CustomList([2, 2, 2]))
+        self.assertTrue(CustomList([2, 2, 2]) == CustomArray([1, 2, 3]))
+        self.assertTrue(CustomArray([1, 2, 3]) != CustomList([1, 2]))
+        self.assertTrue(CustomArray([1, 2]) < CustomList([1, 2, 3]))
+        self.assertTrue(CustomList([1, 2]) < CustomArray([1, 2, 3]))
+        self.assertTrue(CustomArray([1, 2, 3]) > CustomArray([1, 2]))
+        self.assertTrue(CustomArray([1, 2, 3]) >= CustomList([6]))
+        self.assertTrue(CustomArray([1, 2, 3]) <= CustomList([6]))
+        self.assertFalse(CustomArray([1, 2, 3]) > CustomList([6]))
+
+        with self.assertRaises(TypeError) as err:
+            CustomArray([1, 2]) == [1, 2]
+        self.assertEqual(str(err.exception), 'Only the CustomList can be compared')
+
+        with self.assertRaises(TypeError):
+            CustomArray([1, 2]) < 3
+
+    def test_custom_array_str(self):
+        self.assertEqual(str(CustomArray([1, 2.5])), '[1.0, 2.5], 3.5')
+        self.assertEqual(str(CustomArray([])), '[], 0')
+
+    def test_custom_array_arithmetic_without_numpy(self):
+        with mock.patch.object(custom_list, 'np', None):
+            self.assertTrue(custom_eq(CustomArray([1, 2]) + CustomArray([5, 6, 7]), [6, 8, 7]))
+            self.assertTrue(custom_eq(CustomArray([1, 2, 3]) - CustomArray([5]), [-4, 2, 3]))
+            self.assertTrue(custom_eq(CustomArray([5]) - CustomArray([1, 2, 3]), [4, -2, -3]))
+            self.assertTrue(isinstance(CustomArray([1]) - [1, 2], CustomArray))
+
+    def test_custom_array_subclass_arithmetic(self):
+        class Subclass(CustomArray):
+            pass
+
+        for other in [CustomArray([5, 6, 7]), [5, 6, 7]]:
+            result = Subclass([1, 2]) + other
+            self.assertEqual(type(result), Subclass)
+            self.assertEqual(result.tolist(), [6.0, 8.0, 7.0])
+
+
+class TestElementwiseArithmetic(unittest.TestCase):
+    def test_keeps_int_and_float_elements(self):
+        result = CustomList([1, 2.5, 3]) + [1, 1]
+        self.assertEqual(list(result), [2, 3.5, 3])
+        self.assertEqual([type(elem) for elem in result], [int, float, int])
+
+        result = [10, 10] - CustomList([1, 2.5, 3])
+        self.assertEqual(list(result), [9, 7.5, -3])
+        self.assertEqual([type(elem) for elem in result], [int, float, int])
+
+    def test_large_lists(self):
+        left = list(range(100000))
+        right = [0.5] * 99990
+        result = CustomList(left) - CustomList(right)
+        self.assertEqual(list(result), [x - y for x, y in zip(left, right)] + left[99990:])
+
+        result = CustomArray(left) + CustomArray(right)
+        self.assertEqual(list(result), [x + y for x, y in zip(left, right)] + left[99990:])
+
+    def test_operands_are_not_modified(self):
+        custom_array_1 = CustomArray([1, 2, 3])
+        custom_array_2 = CustomArray([4, 5])
+        custom_array_1 - custom_array_2
+        custom_array_2 - custom_array_1
+        self.assertEqual(list(custom_array_1), [1, 2, 3])
+        self.assertEqual(list(custom_array_2), [4, 5])
+
+
+class TestCustomListCachedSum(unittest.TestCase):
+    def assert_sum(self, custom_list):
+        self.assertEqual(custom_list._total(), sum(list(custom_list)))
+        self.assertEqual(type(custom_list._total()), type(sum(list(custom_list))))
+
+    def test_mutations_keep_sum(self):
+        for values in [[1, 2, 3, 4, 5], [0.1, 0.2, 0.3, 0.7, 1.1], [1, 0.1, 2, 0.2, 3]]:
+            custom_list = CustomList(values)
+            self.assert_sum(custom_list)
+
+            custom_list.append(7)
+            self.assert_sum(custom_list)
+            custom_list.append(0.3)
+            self.assert_sum(custom_list)
+            custom_list.extend([1, 2.5])
+            self.assert_sum(custom_list)
+            custom_list.extend(x for x in [3, 4])
+            self.assert_sum(custom_list)
+            custom_list.insert(1, 10)
+            self.assert_sum(custom_list)
+            custom_list[0] = 0.1
+            self.assert_sum(custom_list)
+            custom_list[-1] = 5
+            self.assert_sum(custom_list)
+            custom_list[1:3] = [1, 2, 3]
+            self.assert_sum(custom_list)
+            custom_list[::2] = [0] * len(custom_list[::2])
+            self.assert_sum(custom_list)
+            custom_list.pop()
+            self.assert_sum(custom_list)
+            custom_list.pop(0)
+            self.assert_sum(custom_list)
+            custom_list.remove(custom_list[2])
+            self.assert_sum(custom_list)
+            del custom_list[0]
+            self.assert_sum(custom_list)
+            del custom_list[1:3]
+            self.assert_sum(custom_list)
+            custom_list += [1, 0.5]
+            self.assert_sum(custom_list)
+            custom_list *= 2
+            self.assert_sum(custom_list)
+            custom_list.sort()
+            self.assert_sum(custom_list)
+            custom_list.reverse()
+            self.assert_sum(custom_list)
+            custom_list.clear()
+            self.assert_sum(custom_list)
+
+    def test_float_drift(self):
+        custom_list = CustomList([0.1, 0.2])
+        custom_list.pop(0)
+        self.assertTrue(custom_list == CustomList([0.2]))
+
+        custom_list = CustomList([])
+        custom_list._total()
+        for _ in range(10):
+            custom_list.append(0.1)
+        self.assertEqual(custom_list._total(), sum([0.1] * 10))
+        self.assertEqual(custom_list == CustomList([1.0]), sum([0.1] * 10) == 1.0)
+
+        custom_list = CustomList([1, 2])
+        custom_list._total()
+        custom_list.extend([0.1] * 10)
+        self.assertEqual(custom_list._total(), sum([1, 2] + [0.1] * 10))
+
+    def test_comparisons_use_cached_sum(self):
+        custom_list = CustomList([1, 2, 3])
+        self.assertTrue(custom_list == CustomList([6]))
+        custom_list.append(1)
+        self.assertTrue(custom_list > CustomList([6]))
+        custom_list[0] = -10
+        self.assertTrue(custom_list < CustomList([0]))
+        self.assertEqual(str(custom_list), '[-10, 2, 3, 1], -4')
+
+    def test_sorting_by_sum(self):
+        lists = [CustomList([i % 7, -(i % 3), i % 5]) for i in range(50)]
+        self.assertEqual([sum(elem) for elem in sorted(lists)], sorted(sum(elem) for elem in lists))
+
+    def test_mutations_check_types(self):
+        custom_list = CustomList([1, 2])
+        with self.assertRaises(TypeError):
+            custom_list.append('a')
+        with self.assertRaises(TypeError):
+            custom_list.extend([1, 'a'])
+        with self.assertRaises(TypeError):
+            custom_list[0] = 'a'
+        with self.assertRaises(TypeError):
+            custom_list[0:1] = ['a']
+        with self.assertRaises(TypeError):
+            custom_list.insert(0, None)
+        self.assertEqual(list(custom_list), [1, 2])
+        self.assert_sum(custom_list)
+
+    def test_pickle_and_copy(self):
+        import copy
+        import pickle
+
+        custom_list = CustomList([1, 2.5])
+        self.assertEqual(custom_list._total(), 3.5)
+        for restored in [pickle.loads(pickle.dumps(custom_list)), copy.deepcopy(custom_list)]:
+            self.assertEqual(list(restored), [1, 2.5])
+            self.assert_sum(restored)
+            restored.append(1)
+            self.assert_sum(restored)
+
+
+class TestInPlaceOperators(unittest.TestCase):
+    def test_custom_list_iadd_isub(self):
+        custom_list = CustomList([1, 2, 3])
+        original = custom_list
+        custom_list += [1, 1]
+        self.assertIs(custom_list, original)
+        self.assertEqual(list(custom_list), [2, 3, 3])
+
+        custom_list += CustomList([1, 1, 1, 1, 1])
+        self.assertEqual(list(custom_list), [3, 4, 4, 1, 1])
+
+        custom_list -= CustomArray([1, 1, 1, 1, 1, 2])
+        self.assertTrue(custom_eq(custom_list, [2, 3, 3, 0, 0, -2]))
+        self.assertEqual(custom_list._total(), 6)
+        self.assertTrue(custom_list == CustomList([6]))
+
+    def test_custom_array_iadd_isub(self):
+        for use_numpy in [True, False]:
+            with mock.patch.object(custom_list, 'np', custom_list.np if use_numpy else None):
+                custom_array = CustomArray([1, 2, 3])
+                original = custom_array
+                custom_array += CustomArray([1, 1])
+                custom_array -= [0, 0, 1, 5]
+                custom_array += CustomArray([1, 1, 1, 1, 1])
+                self.assertIs(custom_array, original)
+                self.assertTrue(custom_eq(custom_array, [3, 4, 3, -4, 1]))
+
+                custom_array += custom_array
+                self.assertTrue(custom_eq(custom_array, [6, 8, 6, -8, 2]))
+
+    def test_accumulation_loop(self):
+        acc = CustomList([0] * 5)
+        for i in range(100):
+            acc += [i, 1]
+        self.assertEqual(list(acc), [4950, 100, 0, 0, 0])
+
+    def test_iadd_invalid_type(self):
+        custom_list = CustomList([1, 2])
+        with self.assertRaises(TypeError) as err:
+            custom_list += 'invalid'
+        self.assertEqual(str(err.exception), 'Only the CustomList and default list can be added to the CustomList')
+
+        with self.assertRaises(TypeError):
+            custom_list -= [1, 'invalid']
+        self.assertEqual(list(custom_list), [1, 2])
+
+
+class TestCustomListView(unittest.TestCase):
+    def test_view_reads_parent(self):
+        custom_list = CustomList([1, 2, 3, 4, 5, 6])
+        view = custom_list.view(1, 5)
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), [2, 3, 4, 5])
+        self.assertEqual(view[0], 2)
+        self.assertEqual(view[-1], 5)
+        self.assertEqual(list(view[::2]), [2, 4])
+        self.assertEqual(list(custom_list.view(step=-2)), [6, 4, 2])
+
+        custom_list[2] = 30
+        self.assertEqual(list(view), [2, 30, 4, 5])
+
+    def test_view_writes_parent(self):
+        custom_list = CustomList([1, 2, 3, 4, 5, 6])
+        view = custom_list.view(1, 5)
+        view[0] = 20
+        view[1:3] = [30, 40]
+        self.assertEqual(list(custom_list), [1, 20, 30, 40, 5, 6])
+        self.assertEqual(custom_list._total(), sum([1, 20, 30, 40, 5, 6]))
+
+        view += [1, 1]
+        view[::2] -= CustomList([1, 1])
+        self.assertEqual(list(custom_list), [1, 20, 31, 39, 5, 6])
+
+        custom_array = CustomArray([1, 2, 3])
+        tail = custom_array.view(1)
+        tail += [10, 10]
+        self.assertEqual(list(custom_array), [1, 12, 13])
+
+        with self.assertRaises(ValueError):
+            view[0:2] = [1]
+
+        with self.assertRaises(ValueError):
+            view += [1] * 10
+
+        with self.assertRaises(TypeError):
+            view[0] = 'a'
+
+    def test_view_arithmetic_and_comparison(self):
+        custom_list = CustomList([1, 2, 3, 4])
+        view = custom_list.view(2)
+        self.assertTrue(isinstance(view + [1], CustomList))
+        self.assertEqual(list(view + [1]), [4, 4])
+        self.assertEqual(list([1] - view), [-2, -4])
+        self.assertEqual(list(CustomList([1, 1, 1]) + view), [4, 5, 1])
+        self.assertEqual(list(CustomArray([1]) - view), [-2, -4])
+
+        self.assertTrue(view == CustomList([7]))
+        self.assertTrue(CustomList([7]) == view)
+        self.assertTrue(view > custom_list.view(0, 2))
+        self.assertTrue(view <= CustomArray([7]))
+        self.assertEqual(str(view), '[3, 4], 7')
+
+        with self.assertRaises(TypeError):
+            view == [3, 4]
+
+        with self.assertRaises(TypeError):
+            CustomListView(custom_list, 1)
+
+
+class TestCustomListExpr(unittest.TestCase):
+    def test_lazy_matches_eager(self):
+        a = CustomList([1, 2, 3])
+        b = CustomList([10, 20])
+        c = [0.5, 0.5, 0.5, 0.5]
+        d = CustomArray([1, 1])
+
+        expr = a.lazy() + b - c + d
+        self.assertTrue(isinstance(expr, CustomListExpr))
+        self.assertEqual(len(expr), 4)
+        self.assertEqual(list(expr), list(a + b - c + d))
+        self.assertEqual(expr[1], 22.5)
+        self.assertEqual(expr[-1], -0.5)
+        self.assertEqual(sum(expr), sum(a + b - c + d))
+        self.assertTrue(isinstance(expr.evaluate(), CustomList))
+
+        self.assertEqual(list([1, 1] - a.lazy()), [0, -1, -3])
+        self.assertEqual(list(a - b.lazy()), [-9, -18, 3])
+        self.assertEqual(list(a.lazy() - (b.lazy() + [1])), [-10, -18, 3])
+        self.assertEqual(list(CustomList([]).lazy() + []), [])
+
+    def test_lazy_evaluates_once(self):
+        a = CustomList([1, 2, 3])
+        expr = a.lazy() + [1, 1, 1]
+
+        with mock.patch.object(CustomList, '_from_trusted', wraps=CustomList._from_trusted) as from_trusted:
+            self.assertEqual(list(expr), [2, 3, 4])
+            self.assertEqual(expr[0], 2)
+            self.assertEqual(str(expr), '[2, 3, 4], 9')
+            self.assertEqual(from_trusted.call_count, 1)
+
+        self.assertEqual(list(expr - [2]), [0, 3, 4])
+
+    def test_lazy_comparison_uses_operand_sums(self):
+        a = CustomList([1, 2, 3])
+        b = CustomList([4, 5])
+        expr = a.lazy() - b + [10]
+
+        with mock.patch.object(CustomListExpr, 'evaluate') as evaluate:
+            self.assertTrue(expr == CustomList([7]))
+            self.assertTrue(CustomList([7]) == expr)
+            self.assertTrue(expr < CustomArray([8]))
+            self.assertTrue(expr >= a.lazy() + [1])
+            self.assertTrue(expr != a.view())
+            evaluate.assert_not_called()
+
+        with self.assertRaises(TypeError):
+            expr == [7]
+
+    def test_lazy_operand_validation(self):
+        expr = CustomList([1]).lazy()
+
+        with self.assertRaises(TypeError):
+            expr + (1, 2)
+
+        with self.assertRaises(TypeError):
+            expr - ['a']
+
+        with self.assertRaises(TypeError):
+            'a' + expr
+
+
+class TestCustomListSerialization(unittest.TestCase):
+    def setUp(self):
+        fd, self.path = tempfile.mkstemp()
+        os.close(fd)
+
+    def tearDown(self):
+        os.remove(self.path)
+
+    def test_bytes_round_trip(self):
+        for values in ([], [1, -2, 2 ** 62], [1, 2.5, -3e100]):
+            custom_list = CustomList(values)
+            data = custom_list.to_bytes()
+            self.assertEqual(len(data), 16 + 8 * len(values))
+
+            restored = CustomList.from_bytes(data)
+            self.assertTrue(isinstance(restored, CustomList))
+            self.assertEqual(list(restored), values)
+            self.assertEqual(restored._total(), sum(values))
+
+        self.assertTrue(all(isinstance(elem, int) for elem in CustomList.from_bytes(CustomList([1, 2]).to_bytes())))
+        self.assertTrue(isinstance(CustomList.from_bytes(CustomList([1, 2.5]).to_bytes())[0], float))
+
+        self.assertEqual(list(CustomList.from_bytes(bytearray(CustomList([1, 2]).to_bytes()))), [1, 2])
+        self.assertEqual(list(CustomList.from_bytes(memoryview(CustomList([1.5]).to_bytes()))), [1.5])
+
+    def test_bytes_header_is_little_endian(self):
+        data = CustomList([1, 2]).to_bytes()
+        self.assertEqual(data[:4], b'CLST')
+        self.assertEqual(data[5:6], b'q')
+        self.assertEqual(data[8:16], (2).to_bytes(8, 'little'))
+        self.assertEqual(data[16:24], (1).to_bytes(8, 'little'))
+
+    def test_bytes_invalid(self):
+        data = CustomList([1, 2]).to_bytes()
+
+        with self.assertRaises(ValueError):
+            CustomList.from_bytes(data[:10])
+
+        with self.assertRaises(ValueError):
+            CustomList.from_bytes(b'XXXX' + data[4:])
+
+        with self.assertRaises(ValueError):
+            CustomList.from_bytes(data[:4] + b'\x02' + data[5:])
+
+        with self.assertRaises(ValueError):
+            CustomList.from_bytes(data[:5] + b'i' + data[6:])
+
+        with self.assertRaises(ValueError):
+            CustomList.from_bytes(data[:-1])
+
+    def test_bytes_out_of_range(self):
+        for values in ([2 ** 63], [-2 ** 63 - 1], [1, 2 ** 70], [0.5, 10 ** 400]):
+            with self.assertRaises(ValueError):
+                CustomList(values).to_bytes()
+
+            with self.assertRaises(ValueError):
+                CustomList(values).dump(self.path)
+
+        limits = [2 ** 63 - 1, -2 ** 63]
+        self.assertEqual(list(CustomList.from_bytes(CustomList(limits).to_bytes())), limits)
+        self.assertEqual(list(CustomList.from_bytes(CustomList([0.5, 2 ** 70]).to_bytes())), [0.5, 2.0 ** 70])
+
+    def test_bytes_inexact_int(self):
+        for values in ([2 ** 60 + 1, 0.5], [0.5, -(2 ** 53 + 1)], [1.5, 2 ** 70 + 1]):
+            with self.assertRaises(ValueError):
+                CustomList(values).to_bytes()
+
+            with self.assertRaises(ValueError):
+                CustomList(values).dump(self.path)
+
+        values = [2 ** 53, 0.5, -2 ** 60, True]
+        self.assertEqual(list(CustomList.from_bytes(CustomList(values).to_bytes())), values)
+
+    def test_dump_load(self):
+        custom_list = CustomList([1, 2, 3])
+        custom_list.dump(self.path)
+        restored = CustomList.load(self.path)
+        self.assertTrue(isinstance(restored, CustomList))
+        self.assertEqual(list(restored), [1, 2, 3])
+
+        with open(self.path, 'wb') as f:
+            CustomList([0.5, 1.5]).dump(f)
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(list(CustomList.load(f)), [0.5, 1.5])
+
+    def test_load_mmap(self):
+        CustomList([1, 2, 3, 4]).dump(self.path)
+        view = CustomList.load(self.path, mmap=True)
+        self.assertTrue(isinstance(view, CustomListView))
+        self.assertEqual(len(view), 4)
+        self.assertEqual(list(view), [1, 2, 3, 4])
+        self.assertEqual(list(view[1::2]), [2, 4])
+        self.assertTrue(view == CustomList([10]))
+        self.assertEqual(list(view + [1]), [2, 2, 3, 4])
+
+        with self.assertRaises(TypeError):
+            view[0] = 10
+
+        with open(self.path, 'rb') as f:
+            self.assertEqual(list(CustomList.load(f, mmap=True)), [1, 2, 3, 4])
+
+        CustomList([]).dump(self.path)
+        self.assertEqual(len(CustomList.load(self.path, mmap=True)), 0)
+
+        open(self.path, 'wb').close()
+        with self.assertRaises(ValueError):
+            CustomList.load(self.path, mmap=True)
@@ -0,0 +1,116 @@
+import argparse
+import json
+import platform
+import sys
+import timeit
+from dataclasses import dataclass
+from custom_meta import CustomMeta
+from descriptors import EmailAddressDescriptor, GenderDescriptor, PhoneNumberDescriptor, slotted
+
+
+class Plain:
+    def __init__(self):
+        self.value = 'Male'
+
+
+class Slots:
+    __slots__ = ('value',)
+
+    def __init__(self):
+        self.value = 'Male'
+
+
+@dataclass
+class Data:
+    value: str = 'Male'
+
+
+@dataclass(slots=True)
+class SlotsData:
+    value: str = 'Male'
+
+
+class Meta(metaclass=CustomMeta):
+    def __init__(self):
+        self.value = 'Male'
+
+
+class MetaSlots(metaclass=CustomMeta, slots=('value',)):
+    def __init__(self):
+        self.value = 'Male'
+
+
+class Person:
+    email = EmailAddressDescriptor()
+    phone = PhoneNumberDescriptor()
+    gender = GenderDescriptor()
+
+
+SlottedPerson = slotted(Person)
+
+# Case name, object factory, attribute to read and delete, attribute to write, value to write.
+CASES = [
+    ('plain', Plain, 'value', 'value', 'Male'),
+    ('slots', Slots, 'value', 'value', 'Male'),
+    ('dataclass', Data, 'value', 'value', 'Male'),
+    ('dataclass_slots', SlotsData, 'value', 'value', 'Male'),
+    ('custom_meta', Meta, 'custom_value', 'value', 'Male'),
+    ('custom_meta_slots', MetaSlots, 'custom_value', 'value', 'Male'),
+    ('email_descriptor', Person, 'email', 'email', 'test@example.com'),
+    ('phone_descriptor', Person, 'phone', 'phone', '+7 (123) 456-78-90'),
+    ('gender_descriptor', Person, 'gender', 'gender', 'Male'),
+    ('email_descriptor_slotted', SlottedPerson, 'email', 'email', 'test@example.com'),
+    ('phone_descriptor_slotted', SlottedPerson, 'phone', 'phone', '+7 (123) 456-78-90'),
+    ('gender_descriptor_slotted', SlottedPerson, 'gender', 'gender', 'Male'),
+]
+
+
+def measure(factory, read_name: str, write_name: str, value: str, number: int, repeat: int) -> dict:
+    obj = factory()
+    setattr(obj, write_name, value)
+    namespace = {'obj': obj, 'value': value}
+
+    # Deleting needs a value to delete, so the delete is timed together with the write restoring it.
+    statements = {
+        'get': f'obj.{read_name}',
+        'set': f'obj.{write_name} = value',
+        'set_delete': f'obj.{write_name} = value; del obj.{read_name}',
+    }
+
+    return {operation: min(timeit.repeat(statement, globals=namespace, number=number, repeat=repeat))
+            for operation, statement in statements.items()}
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Measure attribute access overhead of CustomMeta and descriptors')
+    parser.add_argument('--number', type=int, default=1000000, help='operations per measurement')
+    parser.add_argument('--repeat', type=int, default=5, help='measurements per operation, the best one is kept')
+    parser.add_argument('--output', help='path of the JSON file to write the results to')
+    parser.add_argument('--cases', nargs='+', choices=[case[0] for case in CASES], help='cases to run')
+    args = parser.parse_args()
+
+    results = {}
+    for name, factory, read_name, write_name, value in CASES:
+        if args.cases and name not in args.cases:
+            continue
+
+        results[name] = measure(factory, read_name, write_name, value, args.number, args.repeat)
+        timings = ', '.join(f'{operation} {seconds:.3f}s' for operation, seconds in results[name].items())
+        print(f'{name}: {timings}')
+
+    if args.output:
+        report = {
+            'python': platform.python_version(),
+            'implementation': platform.python_implementation(),
+            'platform': sys.platform,
+            'number': args.number,
+            'repeat': args.repeat,
+            'results': results,
+        }
+
+        with open(args.output, 'w') as f:
+            json.dump(report, f, indent=4)
+
+
+if __name__ == '__main__':
+    main()
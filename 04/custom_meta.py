@@ -1,19 +1,217 @@
+from array import array
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+# Py_TPFLAGS_IMMUTABLETYPE: attributes of builtin types like object cannot be changed.
+_IMMUTABLE_TYPE = 1 << 8
+
+
+def _is_dunder(name: str) -> bool:
+    return name.startswith("__") and name.endswith('__')
+
+
+def _custom_name(name: str) -> str:
+    return name if _is_dunder(name) else "custom_" + name
+
+
+class ColumnRow:
+    # Proxy for one row of a ColumnStore. Its fields are properties named like attributes of
+    # CustomMeta instances (custom_x) and read or write the typed column arrays directly.
+    __slots__ = ('columns', 'index')
+    fields = {}
+
+    def __init__(self, columns: Dict[str, array], index: int) -> None:
+        object.__setattr__(self, 'columns', columns)
+        object.__setattr__(self, 'index', index)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        if name in self.fields:
+            name = "custom_" + name
+
+        object.__setattr__(self, name, value)
+
+    def __repr__(self) -> str:
+        values = ", ".join(f"{field}={self.columns[field][self.index]!r}" for field in self.fields)
+        return f"{type(self).__name__}({values})"
+
+
+def _column_property(field: str) -> property:
+    def getter(row):
+        return row.columns[field][row.index]
+
+    def setter(row, value):
+        row.columns[field][row.index] = value
+
+    return property(getter, setter)
+
+
+class ColumnStore:
+    # Struct-of-arrays container generated by CustomMeta(columns=...): the values of every field
+    # are kept in one typed array, so a whole column can be scanned without creating objects.
+    row_class = ColumnRow
+    fields = {}
+
+    def __init__(self) -> None:
+        self.columns = {field: array(typecode) for field, typecode in self.fields.items()}
+
+    def _field(self, name: str) -> str:
+        if name not in self.fields and name.startswith("custom_") and name[len("custom_"):] in self.fields:
+            name = name[len("custom_"):]
+
+        if name not in self.fields:
+            raise KeyError(name)
+
+        return name
+
+    def column(self, name: str) -> array:
+        return self.columns[self._field(name)]
+
+    def append(self, **values: Any) -> ColumnRow:
+        values = {self._field(name): value for name, value in values.items()}
+        if len(values) != len(self.fields):
+            raise TypeError(f"Values of all fields are required: {', '.join(self.fields)}")
+
+        # Every value is converted first, so a wrong one leaves the columns aligned.
+        converted = {field: array(self.fields[field], [value]) for field, value in values.items()}
+        for field, value in converted.items():
+            self.columns[field].extend(value)
+
+        return self.row_class(self.columns, len(self) - 1)
+
+    def extend(self, objects: Iterable[Any]) -> None:
+        # Takes instances of the class the store belongs to, reading their custom_ attributes.
+        for obj in objects:
+            self.append(**{field: getattr(obj, "custom_" + field) for field in self.fields})
+
+    def __len__(self) -> int:
+        for column in self.columns.values():
+            return len(column)
+        return 0
+
+    def __getitem__(self, index: int) -> ColumnRow:
+        size = len(self)
+        if index < 0:
+            index += size
+
+        if not 0 <= index < size:
+            raise IndexError('ColumnStore index out of range')
+
+        return self.row_class(self.columns, index)
+
+    def __iter__(self) -> Iterator[ColumnRow]:
+        row_class = self.row_class
+        columns = self.columns
+        return (row_class(columns, index) for index in range(len(self)))
+
+
+def _make_store(name: str, columns: Dict[str, str]) -> type:
+    for field, typecode in columns.items():
+        if not isinstance(field, str) or _is_dunder(field):
+            raise ValueError(f"Invalid column name: {field!r}")
+
+        array(typecode)
+
+    row_dct = {'__slots__': (), 'fields': dict(columns)}
+    for field in columns:
+        row_dct["custom_" + field] = _column_property(field)
+
+    row_class = type(f"{name}Row", (ColumnRow,), row_dct)
+    return type(f"{name}Store", (ColumnStore,), {'row_class': row_class, 'fields': dict(columns)})
+
+
 class CustomMeta(type):
-    def __new__(mcs, name, bases, dct):
+    def __new__(mcs, name, bases, dct, slots: Optional[Iterable[str]] = None,
+                columns: Optional[Dict[str, str]] = None):
         new_dct = {}
         for key, value in dct.items():
-            if not key.startswith("__") or not key.endswith('__'):
-                new_dct["custom_" + key] = value
-            else:
-                new_dct[key] = value
+            new_dct[_custom_name(key)] = value
+
+        if slots is not None:
+            new_dct['__slots__'] = tuple(_custom_name(slot) for slot in slots)
 
         new_class = super().__new__(mcs, name, bases, new_dct)
+        if columns is not None:
+            type.__setattr__(new_class, '__store__', _make_store(name, columns))
+
+        # Maps a written name to the name it is stored under, as far as the class decides it;
+        # for classes without instance __dict__ to the __set__ of the slot it is stored in.
+        # A name already present in the instance __dict__ is still written as is. The cache is
+        # cleared whenever the class or one of its bases is changed through the metaclass, and
+        # not used at all for classes with other mutable bases.
+        names = {}
+        type.__setattr__(new_class, '__custom_names__', names)
+
+        def translate(self, name):
+            cls = type(self)
+            if cls.__getattribute__ is not object.__getattribute__ or hasattr(cls, '__getattr__'):
+                # Dynamic attributes cannot be decided per class.
+                return name if _is_dunder(name) or hasattr(self, name) else "custom_" + name, False
+
+            if _is_dunder(name):
+                target = name
+            else:
+                for klass in cls.__mro__:
+                    if name in klass.__dict__:
+                        if hasattr(type(klass.__dict__[name]), '__get__'):
+                            # A descriptor, like an unset slot or a property, may raise AttributeError
+                            # depending on the instance, so it is decided by hasattr() on every write.
+                            return name if hasattr(self, name) else "custom_" + name, False
+
+                        target = name
+                        break
+                else:
+                    target = "custom_" + name
 
-        def custom_setattr(self, name, value):
-            if (not name.startswith("__") or not name.endswith('__')) and not hasattr(self, name):
-                name = "custom_" + name
+            # Changes of other mutable bases do not clear the cache, so their names stay undecided.
+            cacheable = cls is new_class and all(isinstance(klass, CustomMeta) or klass.__flags__ & _IMMUTABLE_TYPE
+                                                 for klass in cls.__mro__)
+            return target, cacheable
 
-            self.__dict__[name] = value
+        if new_class.__dictoffset__:
+            def custom_setattr(self, name, value):
+                instance_dict = self.__dict__
+                if name not in instance_dict:
+                    target = names.get(name)
+                    if target is None:
+                        target, cacheable = translate(self, name)
+                        if cacheable:
+                            names[name] = target
+                    name = target
+
+                instance_dict[name] = value
+        else:
+            def custom_setattr(self, name, value):
+                setter = names.get(name)
+                if setter is not None:
+                    return setter(self, value)
+
+                target, cacheable = translate(self, name)
+                object.__setattr__(self, target, value)
+
+                if cacheable:
+                    for klass in new_class.__mro__:
+                        if target in klass.__dict__:
+                            setter = getattr(klass.__dict__[target], '__set__', None)
+                            if setter is not None:
+                                names[name] = setter
+                            break
 
         new_class.__setattr__ = custom_setattr
         return new_class
+
+    def __setattr__(cls, name, value):
+        super().__setattr__(name, value)
+        cls._clear_custom_names()
+
+    def __delattr__(cls, name):
+        super().__delattr__(name)
+        cls._clear_custom_names()
+
+    def _clear_custom_names(cls):
+        classes = [cls]
+        while classes:
+            klass = classes.pop()
+            names = klass.__dict__.get('__custom_names__')
+            if names is not None:
+                names.clear()
+            classes.extend(klass.__subclasses__())
@@ -0,0 +1,56 @@
+import argparse
+import timeit
+from custom_meta import CustomMeta
+
+
+class LegacyCustomMeta(type):
+    def __new__(mcs, name, bases, dct):
+        new_dct = {}
+        for key, value in dct.items():
+            if not key.startswith("__") or not key.endswith('__'):
+                new_dct["custom_" + key] = value
+            else:
+                new_dct[key] = value
+
+        new_class = super().__new__(mcs, name, bases, new_dct)
+
+        def custom_setattr(self, name, value):
+            if (not name.startswith("__") or not name.endswith('__')) and not hasattr(self, name):
+                name = "custom_" + name
+
+            self.__dict__[name] = value
+
+        new_class.__setattr__ = custom_setattr
+        return new_class
+
+
+class Plain:
+    pass
+
+
+class Legacy(metaclass=LegacyCustomMeta):
+    pass
+
+
+class Cached(metaclass=CustomMeta):
+    pass
+
+
+class Slotted(metaclass=CustomMeta, slots=('value',)):
+    pass
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Compare attribute writes on CustomMeta classes')
+    parser.add_argument('--number', type=int, default=1000000, help='number of writes per measurement')
+    args = parser.parse_args()
+
+    for cls in (Plain, Legacy, Cached, Slotted):
+        obj = cls()
+        obj.value = 0
+        write_time = min(timeit.repeat('obj.value = 1', globals={'obj': obj}, number=args.number, repeat=5))
+        print(f'{cls.__name__} write time: {write_time:.3f} seconds')
+
+
+if __name__ == '__main__':
+    main()
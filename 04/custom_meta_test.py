@@ -1,4 +1,5 @@
 import unittest
+from array import array
 from custom_meta import CustomMeta
 
 
@@ -160,3 +161,196 @@ class TestCustomMeta(unittest.TestCase):
         self.assertTrue(hasattr(self.child, "__qwe__"))
         self.assertFalse(hasattr(self.child, "custom___qwe__"))
         self.assertEqual(self.child.__qwe__, 10)
+
+
+class TestCustomMetaNameCache(unittest.TestCase):
+    def setUp(self):
+        class TestClass(metaclass=CustomMeta):
+            my_attr = 42
+
+            def __init__(self):
+                self.a = 1
+
+        class Derived(TestClass):
+            pass
+
+        self.cls = TestClass
+        self.child_cls = Derived
+
+    def test_cache_is_filled(self):
+        obj = self.cls()
+        obj.b = 2
+        obj.__x__ = 3
+        self.assertEqual(obj.__dict__, {'custom_a': 1, 'custom_b': 2, '__x__': 3})
+        self.assertEqual(self.cls.__custom_names__, {'a': 'custom_a', 'b': 'custom_b', '__x__': '__x__'})
+
+        obj.custom_a = 10
+        self.assertEqual(obj.__dict__['custom_a'], 10)
+        self.assertFalse(hasattr(obj, 'custom_custom_a'))
+
+        other = self.cls()
+        other.__dict__['c'] = 0
+        other.c = 5
+        other.custom_c = 6
+        self.assertEqual(other.__dict__['c'], 5)
+        self.assertEqual(other.__dict__['custom_custom_c'], 6)
+
+    def test_cache_is_cleared_on_class_change(self):
+        obj = self.child_cls()
+        obj.z = 1
+        self.assertEqual(obj.custom_z, 1)
+
+        self.cls.z = 0
+        self.assertEqual(self.cls.__custom_names__, {})
+        self.assertEqual(self.child_cls.__custom_names__, {})
+
+        obj = self.child_cls()
+        obj.z = 2
+        self.assertEqual(obj.__dict__['z'], 2)
+
+        del self.cls.z
+        obj = self.child_cls()
+        obj.z = 3
+        self.assertEqual(obj.__dict__['custom_z'], 3)
+
+    def test_plain_base_is_not_cached(self):
+        class Base:
+            pass
+
+        class Mixed(Base, metaclass=CustomMeta):
+            pass
+
+        obj = Mixed()
+        obj.x = 1
+        self.assertEqual(obj.__dict__, {'custom_x': 1})
+        self.assertEqual(Mixed.__custom_names__, {})
+
+        Base.x = 5
+        obj = Mixed()
+        obj.x = 2
+        self.assertEqual(obj.__dict__, {'x': 2})
+
+    def test_descriptor_names_follow_hasattr(self):
+        class WithProperty(metaclass=CustomMeta):
+            @property
+            def email(self):
+                return self.stored
+
+        obj = WithProperty()
+        for _ in range(2):
+            obj.custom_email = 'a@b.cd'
+        self.assertEqual(obj.__dict__, {'custom_custom_email': 'a@b.cd'})
+
+        obj = WithProperty()
+        obj.__dict__['stored'] = 'x@y.zw'
+        obj.custom_email = 'a@b.cd'
+        self.assertEqual(obj.__dict__, {'stored': 'x@y.zw', 'custom_email': 'a@b.cd'})
+        self.assertNotIn('custom_email', WithProperty.__custom_names__)
+
+    def test_dynamic_attributes_are_not_cached(self):
+        class Dynamic(metaclass=CustomMeta):
+            def __getattr__(self, name):
+                if name == 'virtual':
+                    return 0
+                raise AttributeError(name)
+
+        obj = Dynamic()
+        obj.virtual = 1
+        obj.real = 2
+        self.assertEqual(obj.__dict__, {'virtual': 1, 'custom_real': 2})
+        self.assertEqual(Dynamic.__custom_names__, {})
+
+    def test_slots(self):
+        class Slotted(metaclass=CustomMeta, slots=('a', 'b')):
+            def __init__(self):
+                self.a = 1
+
+        obj = Slotted()
+        self.assertEqual(Slotted.__slots__, ('custom_a', 'custom_b'))
+        self.assertFalse(hasattr(obj, '__dict__'))
+        self.assertEqual(obj.custom_a, 1)
+        self.assertFalse(hasattr(obj, 'custom_b'))
+
+        obj.b = 2
+        obj.custom_b = 3
+        self.assertEqual(obj.custom_b, 3)
+        self.assertEqual(set(Slotted.__custom_names__), {'a', 'b'})
+
+        with self.assertRaises(AttributeError):
+            obj.c = 4
+
+        class SlottedChild(Slotted, slots=('c',)):
+            pass
+
+        child = SlottedChild()
+        child.c = 5
+        self.assertEqual((child.custom_a, child.custom_c), (1, 5))
+
+
+class TestCustomMetaColumns(unittest.TestCase):
+    def setUp(self):
+        class Point(metaclass=CustomMeta, columns={'x': 'd', 'count': 'q'}):
+            def __init__(self, x, count):
+                self.x = x
+                self.count = count
+
+        self.cls = Point
+        self.store = Point.__store__()
+
+    def test_store_class(self):
+        self.assertEqual(self.cls.__store__.__name__, 'PointStore')
+        self.assertEqual(self.cls.__store__.fields, {'x': 'd', 'count': 'q'})
+        self.assertEqual(self.cls(1.5, 2).custom_x, 1.5)
+        self.assertEqual(len(self.store), 0)
+        self.assertEqual(list(self.store), [])
+
+    def test_append_and_columns(self):
+        row = self.store.append(x=1.5, count=2)
+        self.store.append(x=2.5, custom_count=3)
+        self.store.extend([self.cls(0.5, 7)])
+
+        self.assertEqual(len(self.store), 3)
+        self.assertEqual(self.store.column('x'), array('d', [1.5, 2.5, 0.5]))
+        self.assertEqual(self.store.column('custom_count'), array('q', [2, 3, 7]))
+        self.assertEqual(sum(self.store.column('count')), 12)
+
+        self.assertEqual(row.custom_x, 1.5)
+        self.assertEqual(self.store[-1].custom_count, 7)
+        self.assertEqual([row.custom_x for row in self.store], [1.5, 2.5, 0.5])
+        self.assertEqual(repr(row), 'PointRow(x=1.5, count=2)')
+
+        with self.assertRaises(KeyError):
+            self.store.column('y')
+
+        with self.assertRaises(IndexError):
+            self.store[3]
+
+    def test_row_proxy(self):
+        row = self.store.append(x=1.5, count=2)
+        self.assertFalse(hasattr(row, 'x'))
+        self.assertFalse(hasattr(row, '__dict__'))
+
+        row.x = 4.0
+        row.custom_count = 5
+        self.assertEqual(self.store.column('x')[0], 4.0)
+        self.assertEqual(self.store.column('count')[0], 5)
+
+        with self.assertRaises(TypeError):
+            row.count = 'a'
+
+        with self.assertRaises(AttributeError):
+            row.y = 1
+
+    def test_invalid_values(self):
+        with self.assertRaises(TypeError):
+            self.store.append(x=1.0)
+
+        with self.assertRaises(TypeError):
+            self.store.append(x=1.0, count=1.5)
+
+        self.assertEqual(len(self.store.column('x')), len(self.store.column('count')))
+        self.assertEqual(len(self.store), 0)
+
+        with self.assertRaises(ValueError):
+            class Broken(metaclass=CustomMeta, columns={'x': 'z'}):
+                pass
@@ -1,18 +1,44 @@
 import re
+from functools import lru_cache
+from itertools import compress, repeat
+from operator import attrgetter, not_
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+from custom_meta import CustomMeta
 
 
-class EmailAddressDescriptor:
+class _ValidatedDescriptor:
+    suffix = ''
+    error = ''
+
+    def __init__(self, cache_size: Optional[int] = None) -> None:
+        # Values are validated by a bound method, so an optional LRU memo of recent
+        # results can be put in front of it per descriptor.
+        if cache_size is not None:
+            if not isinstance(cache_size, int):
+                raise TypeError
+
+            if cache_size <= 0:
+                raise ValueError("cache_size must be positive")
+
+            self.is_valid = lru_cache(maxsize=cache_size)(self.is_valid)
+
+    def _valid_flags(self, values: Sequence) -> Iterable:
+        return [isinstance(value, str) and self.is_valid(value) for value in values]
+
+    def invalid_rows(self, values: Sequence) -> List[int]:
+        return list(compress(range(len(values)), map(not_, self._valid_flags(values))))
+
     def __set_name__(self, owner, name):
-        self.name = f'{name}_email_field'
+        self.name = f'{name}{self.suffix}'
 
     def __set__(self, instance, value):
         if instance is None:
             return
 
-        if isinstance(value, str) and re.match(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$", value):
+        if isinstance(value, str) and self.is_valid(value):
             return setattr(instance, self.name, value)
         else:
-            raise ValueError(f"{self.name} must be a valid email address")
+            raise ValueError(f"{self.name} {self.error}")
 
     def __get__(self, instance, cls=None):
         if instance is None:
@@ -27,54 +53,189 @@ class EmailAddressDescriptor:
         return delattr(instance, self.name)
 
 
-class PhoneNumberDescriptor:
-    def __set_name__(self, owner, name):
-        self.name = f'{name}_phone_number_field'
+class _PatternDescriptor(_ValidatedDescriptor):
+    # Validates by a compiled regular expression, set as the pattern of subclasses.
+    def is_valid(self, value: str) -> bool:
+        return self.pattern.match(value) is not None
 
-    def __set__(self, instance, value):
-        if instance is None:
-            return
+    def _valid_flags(self, values: Sequence) -> Iterable:
+        # A column of strings is matched by map() without a Python-level call per value.
+        if all(map(isinstance, values, repeat(str))):
+            return map(self.pattern.match, values)
 
-        if isinstance(value, str) and (re.match(r"^\+7\s?\(\d{3}\)\s?\d{3}[-\s]?\d{2}[-\s]?\d{2}$", value) or
-                                       re.match(r"^\+7\s?\d{3}\s?\d{3}[-\s]?\d{2}[-\s]?\d{2}$", value)):
-            return setattr(instance, self.name, value)
-        else:
-            raise ValueError(f"{self.name} must be a valid russian phone number")
+        return super()._valid_flags(values)
 
-    def __get__(self, instance, cls=None):
-        if instance is None:
-            return
 
-        return getattr(instance, self.name)
+class EmailAddressDescriptor(_PatternDescriptor):
+    suffix = '_email_field'
+    error = "must be a valid email address"
+    pattern = re.compile(r"^[a-zA-Z0-9._%+-]+@[a-zA-Z0-9.-]+\.[a-zA-Z]{2,}$")
 
-    def __delete__(self, instance):
-        if instance is None:
-            return
 
-        return delattr(instance, self.name)
+class PhoneNumberDescriptor(_PatternDescriptor):
+    suffix = '_phone_number_field'
+    error = "must be a valid russian phone number"
+    pattern = re.compile(r"^\+7\s?(?:\(\d{3}\)|\d{3})\s?\d{3}[-\s]?\d{2}[-\s]?\d{2}$")
 
 
-class GenderDescriptor:
-    def __set_name__(self, owner, name):
-        self.name = f'{name}_gender_field'
+class GenderDescriptor(_ValidatedDescriptor):
+    suffix = '_gender_field'
+    error = "must be 'Male' or 'Female'"
+    values = frozenset(["Male", "Female"])
 
-    def __set__(self, instance, value):
-        if instance is None:
-            return
+    def is_valid(self, value: str) -> bool:
+        return value in self.values
 
-        if value in ["Male", "Female"]:
-            return setattr(instance, self.name, value)
-        else:
-            raise ValueError(f"{self.name} must be 'Male' or 'Female'")
+    def _valid_flags(self, values: Sequence) -> Iterable:
+        if all(map(isinstance, values, repeat(str))):
+            return map(self.values.__contains__, values)
 
-    def __get__(self, instance, cls=None):
-        if instance is None:
-            return
+        return super()._valid_flags(values)
 
-        return getattr(instance, self.name)
 
-    def __delete__(self, instance):
-        if instance is None:
-            return
+class SlotField(property):
+    # Field of a @slotted class: reads go through property.__get__ and attrgetter straight to the
+    # slot, both implemented in C, while writes still go through the validating descriptor.
+    def __init__(self, descriptor: _ValidatedDescriptor) -> None:
+        super().__init__(attrgetter(descriptor.name), descriptor.__set__, descriptor.__delete__)
+        self.descriptor = descriptor
 
-        return delattr(instance, self.name)
+
+def _rebind_class_cell(value, old_class: type, new_class: type) -> None:
+    # Functions using zero-argument super() or __class__ keep the class in a closure cell.
+    if isinstance(value, (classmethod, staticmethod)):
+        value = value.__func__
+
+    if isinstance(value, property):
+        functions = [value.fget, value.fset, value.fdel]
+    else:
+        functions = [value]
+
+    for function in functions:
+        code = getattr(function, '__code__', None)
+        if code is None or '__class__' not in code.co_freevars:
+            continue
+
+        cell = function.__closure__[code.co_freevars.index('__class__')]
+        if cell.cell_contents is old_class:
+            cell.cell_contents = new_class
+
+
+def slotted(cls: type) -> type:
+    # Instances of the returned class keep descriptor-managed values in __slots__ instead of a
+    # per-instance __dict__. Slots declared by the class itself are kept, any other instance
+    # attribute can no longer be set, and bases without __slots__ still bring a __dict__ along.
+    # The class is created anew, like dataclass(slots=True) does.
+    if isinstance(cls, CustomMeta):
+        # Recreating the class would prefix its already prefixed names a second time.
+        raise TypeError("slotted cannot be applied to CustomMeta classes, use their slots= option")
+
+    slots = cls.__dict__.get('__slots__', ())
+    if isinstance(slots, str):
+        slots = (slots,)
+
+    dct = {key: value for key, value in cls.__dict__.items()
+           if key not in ('__dict__', '__weakref__') and key not in slots}
+    fields = {key: value for key, value in dct.items() if isinstance(value, _ValidatedDescriptor)}
+
+    dct['__slots__'] = tuple(slots) + tuple(descriptor.name for descriptor in fields.values())
+    dct['__qualname__'] = cls.__qualname__
+
+    new_class = type(cls)(cls.__name__, cls.__bases__, dct)
+    for value in new_class.__dict__.values():
+        _rebind_class_cell(value, cls, new_class)
+
+    for key, descriptor in fields.items():
+        setattr(new_class, key, SlotField(descriptor))
+
+    return new_class
+
+
+class ValidationError(ValueError):
+    def __init__(self, errors: List[Tuple[int, str, str]]) -> None:
+        self.errors = errors
+        super().__init__("\n".join(f"row {row}: {message}" for row, _, message in errors))
+
+
+def _fields(cls: type) -> Dict[str, _ValidatedDescriptor]:
+    fields = {}
+    for klass in reversed(cls.__mro__):
+        for key, value in klass.__dict__.items():
+            if isinstance(value, SlotField):
+                fields[key] = value.descriptor
+            elif isinstance(value, _ValidatedDescriptor):
+                fields[key] = value
+            else:
+                fields.pop(key, None)
+
+    return fields
+
+
+@lru_cache(maxsize=None)
+def _row_builder(names: Tuple[str, ...]):
+    # Generated per set of storage names, like the __init__ of a dataclass: plain attribute
+    # stores with constant names are much cheaper than setattr() with names known at runtime.
+    values = [f"value{index}" for index in range(len(names))]
+    lines = ["def build(cls, rows):",
+             "    new = cls.__new__",
+             "    instances = []",
+             f"    for {', '.join(values)}, in rows:",
+             "        instance = new(cls)",
+             *(f"        instance.{name} = {value}" for name, value in zip(names, values)),
+             "        instances.append(instance)",
+             "    return instances"]
+
+    namespace = {}
+    exec("\n".join(lines), namespace)
+    return namespace['build']
+
+
+def _build_rows(cls: type, names: Tuple[str, ...], rows: Iterable[tuple]) -> list:
+    instances = []
+    for row in rows:
+        instance = cls.__new__(cls)
+        for name, value in zip(names, row):
+            object.__setattr__(instance, name, value)
+        instances.append(instance)
+
+    return instances
+
+
+def from_columns(cls: type, **columns: Sequence) -> list:
+    # Builds one instance per row from equally long columns named after the descriptor fields of
+    # cls. Every column is validated as a whole and all invalid rows are reported in a single
+    # ValidationError. Instances are created without calling __init__, and values are stored
+    # directly, bypassing the descriptors. Classes get it as a classmethod from FromColumnsMixin.
+    fields = _fields(cls)
+    for key in columns:
+        if key not in fields:
+            raise ValueError(f"{cls.__name__} has no validated field {key}")
+
+    columns = {key: column if isinstance(column, (list, tuple)) else list(column)
+               for key, column in columns.items()}
+    if len(set(map(len, columns.values()))) > 1:
+        raise ValueError("All columns must have the same length")
+
+    errors = []
+    for key, column in columns.items():
+        descriptor = fields[key]
+        message = f"{descriptor.name} {descriptor.error}"
+        errors.extend((row, key, message) for row in descriptor.invalid_rows(column))
+
+    if errors:
+        errors.sort(key=lambda error: error[0])
+        raise ValidationError(errors)
+
+    names = tuple(fields[key].name for key in columns)
+    rows = zip(*columns.values())
+
+    if names and cls.__setattr__ is object.__setattr__ and all(name.isidentifier() for name in names):
+        return _row_builder(names)(cls, rows)
+
+    return _build_rows(cls, names, rows)
+
+
+class FromColumnsMixin:
+    # Empty __slots__ keep @slotted subclasses free of a per-instance __dict__.
+    __slots__ = ()
+    from_columns = classmethod(from_columns)
@@ -1,5 +1,8 @@
+import re
 import unittest
-from descriptors import EmailAddressDescriptor, GenderDescriptor, PhoneNumberDescriptor
+from descriptors import EmailAddressDescriptor, GenderDescriptor, PhoneNumberDescriptor, SlotField, slotted
+from descriptors import FromColumnsMixin, ValidationError, from_columns
+from custom_meta import CustomMeta
 
 
 class TestDescriptors(unittest.TestCase):
@@ -222,3 +225,268 @@ class TestDescriptors(unittest.TestCase):
         self.assertEqual(str(err.exception), "gender_gender_field must be 'Male' or 'Female'")
 
         self.assertEqual(self.person.gender, "Male")
+
+
+class TestDescriptorValidators(unittest.TestCase):
+    def test_merged_phone_pattern(self):
+        phones = ["+7(123)456-78-90", "+7 (123) 456-78-90", "+7 123 456-78-90", "+71234567890",
+                  "+7 123 456 78 90", "+7(123) 4567890", "+7 (123)456 78-90", "+7(1234567890",
+                  "+7123)4567890", "+7(123456) 78-90", "+7 1234 5678 90", "+7  123 456 78 90",
+                  "+7 12-34-56-78-90", "+1 234 567 89 00", "+72345678", "+7 (12) 3456-78-90"]
+
+        for phone in phones:
+            expected = bool(re.match(r"^\+7\s?\(\d{3}\)\s?\d{3}[-\s]?\d{2}[-\s]?\d{2}$", phone) or
+                            re.match(r"^\+7\s?\d{3}\s?\d{3}[-\s]?\d{2}[-\s]?\d{2}$", phone))
+            self.assertEqual(PhoneNumberDescriptor().is_valid(phone), expected, phone)
+
+    def test_pattern_validation(self):
+        class CorporateEmailDescriptor(EmailAddressDescriptor):
+            pattern = re.compile(r"^[a-z.]+@corp\.ru$")
+
+        self.assertIs(EmailAddressDescriptor.is_valid, PhoneNumberDescriptor.is_valid)
+        self.assertTrue(CorporateEmailDescriptor().is_valid("ivan.ivanov@corp.ru"))
+        self.assertFalse(CorporateEmailDescriptor().is_valid("ivan.ivanov@mail.ru"))
+        self.assertTrue(EmailAddressDescriptor().is_valid("ivan.ivanov@mail.ru"))
+
+        class Employee:
+            email = CorporateEmailDescriptor(cache_size=2)
+
+        employee = Employee()
+        employee.email = "ivan@corp.ru"
+        with self.assertRaises(ValueError):
+            employee.email = "ivan@mail.ru"
+
+        self.assertEqual(employee.email, "ivan@corp.ru")
+
+    def test_cached_validation(self):
+        class Person:
+            email = EmailAddressDescriptor(cache_size=2)
+            phone = PhoneNumberDescriptor(cache_size=2)
+            gender = GenderDescriptor(cache_size=2)
+
+        person = Person()
+        for _ in range(3):
+            person.email = "test@example.com"
+            person.phone = "+7 123 456-78-90"
+            person.gender = "Female"
+
+        self.assertEqual((person.email, person.phone, person.gender),
+                         ("test@example.com", "+7 123 456-78-90", "Female"))
+
+        descriptor = Person.__dict__['email']
+        self.assertEqual(descriptor.is_valid.cache_info().hits, 2)
+        self.assertEqual(descriptor.is_valid.cache_info().misses, 1)
+
+        for _ in range(2):
+            with self.assertRaises(ValueError) as err:
+                person.email = "test@example"
+
+            self.assertEqual(str(err.exception), 'email_email_field must be a valid email address')
+
+        with self.assertRaises(ValueError):
+            person.email = ["test@example.com"]
+
+        self.assertEqual(descriptor.is_valid.cache_info().currsize, 2)
+        self.assertEqual(person.email, "test@example.com")
+
+    def test_cache_size_validation(self):
+        with self.assertRaises(TypeError):
+            EmailAddressDescriptor(cache_size='10')
+
+        with self.assertRaises(ValueError):
+            PhoneNumberDescriptor(cache_size=0)
+
+        self.assertFalse(hasattr(GenderDescriptor().is_valid, 'cache_info'))
+
+
+class TestSlottedDescriptors(unittest.TestCase):
+    def setUp(self):
+        @slotted
+        class Person:
+            __slots__ = 'name'
+
+            email = EmailAddressDescriptor()
+            phone = PhoneNumberDescriptor()
+            gender = GenderDescriptor(cache_size=2)
+
+            def __init__(self, name):
+                self.name = name
+
+        self.cls = Person
+        self.person = Person('Ivan')
+
+    def test_slots(self):
+        self.assertEqual(self.cls.__slots__, ('name', 'email_email_field', 'phone_phone_number_field',
+                                              'gender_gender_field'))
+        self.assertFalse(hasattr(self.person, '__dict__'))
+        self.assertEqual(self.cls.__qualname__, 'TestSlottedDescriptors.setUp.<locals>.Person')
+        self.assertEqual(self.person.name, 'Ivan')
+        self.assertTrue(isinstance(self.cls.email, SlotField))
+        self.assertTrue(isinstance(self.cls.email.descriptor, EmailAddressDescriptor))
+
+        with self.assertRaises(AttributeError):
+            self.person.age = 30
+
+    def test_get_set_delete(self):
+        self.assertFalse(hasattr(self.person, 'email'))
+
+        self.person.email = "test@example.com"
+        self.person.phone = "+7 (123) 456-78-90"
+        self.person.gender = "Male"
+        self.assertEqual(self.person.email, "test@example.com")
+        self.assertEqual(self.person.phone, "+7 (123) 456-78-90")
+        self.assertEqual(self.person.gender, "Male")
+        self.assertEqual(self.person.email_email_field, "test@example.com")
+
+        del self.person.phone
+        self.assertFalse(hasattr(self.person, 'phone'))
+        self.assertFalse(hasattr(self.person, 'phone_phone_number_field'))
+
+    def test_validation(self):
+        self.person.email = "test@example.com"
+
+        with self.assertRaises(ValueError) as err:
+            self.person.email = "test@example"
+
+        self.assertEqual(str(err.exception), 'email_email_field must be a valid email address')
+        self.assertEqual(self.person.email, "test@example.com")
+
+        with self.assertRaises(ValueError) as err:
+            self.person.gender = "Other"
+
+        self.assertEqual(str(err.exception), "gender_gender_field must be 'Male' or 'Female'")
+
+    def test_super_calls(self):
+        class Base:
+            __slots__ = ()
+
+            def __init__(self, email):
+                self.email = email
+
+            def describe(self):
+                return 'base'
+
+        @slotted
+        class Contact(Base):
+            email = EmailAddressDescriptor()
+
+            def __init__(self, email):
+                super().__init__(email)
+
+            def describe(self):
+                return f'contact of {super().describe()}'
+
+            @property
+            def domain(self):
+                return __class__.__name__ + ':' + self.email.split('@')[1]
+
+            @classmethod
+            def create(cls):
+                return super(__class__, cls).__new__(cls)
+
+        contact = Contact("a@b.cd")
+        self.assertEqual(contact.email, "a@b.cd")
+        self.assertEqual(contact.describe(), 'contact of base')
+        self.assertEqual(contact.domain, 'Contact:b.cd')
+        self.assertTrue(isinstance(Contact.create(), Contact))
+        self.assertFalse(hasattr(contact, '__dict__'))
+
+    def test_custom_meta_class(self):
+        class Meta(metaclass=CustomMeta):
+            email = EmailAddressDescriptor()
+
+        with self.assertRaises(TypeError):
+            slotted(Meta)
+
+    def test_class_without_slots(self):
+        @slotted
+        class Contact:
+            email = EmailAddressDescriptor()
+
+        contact = Contact()
+        contact.email = "a@b.cd"
+        self.assertEqual(contact.email, "a@b.cd")
+        self.assertEqual(Contact.__slots__, ('email_email_field',))
+        self.assertFalse(hasattr(contact, '__dict__'))
+
+
+class TestFromColumns(unittest.TestCase):
+    def setUp(self):
+        class Person(FromColumnsMixin):
+            email = EmailAddressDescriptor()
+            phone = PhoneNumberDescriptor()
+            gender = GenderDescriptor()
+
+            def __init__(self):
+                raise AssertionError('__init__ must not be called')
+
+        self.cls = Person
+        self.emails = ["a@b.cd", "test@example.com", "x.y@z.ru"]
+        self.phones = ["+71234567890", "+7 (123) 456-78-90", "+7 123 456 78 90"]
+        self.genders = ["Male", "Female", "Male"]
+
+    def check_instances(self, people):
+        self.assertEqual([person.email for person in people], self.emails)
+        self.assertEqual([person.phone for person in people], self.phones)
+        self.assertEqual([person.gender for person in people], self.genders)
+
+    def test_valid_columns(self):
+        people = self.cls.from_columns(email=self.emails, phone=self.phones, gender=self.genders)
+        self.assertEqual(len(people), 3)
+        self.assertTrue(all(isinstance(person, self.cls) for person in people))
+        self.check_instances(people)
+        self.assertEqual(people[0].__dict__, {'email_email_field': "a@b.cd", 'phone_phone_number_field': "+71234567890",
+                                              'gender_gender_field': "Male"})
+
+        people[0].email = "new@mail.ru"
+        self.assertEqual(people[0].email, "new@mail.ru")
+
+        self.assertEqual(from_columns(self.cls, email=iter(self.emails))[2].email, "x.y@z.ru")
+        self.assertEqual(from_columns(self.cls), [])
+
+    def test_slotted_class(self):
+        people = slotted(self.cls).from_columns(email=self.emails, phone=self.phones, gender=self.genders)
+        self.check_instances(people)
+        self.assertFalse(hasattr(people[0], '__dict__'))
+
+    def test_class_with_custom_setattr(self):
+        class Locked(self.cls):
+            def __setattr__(self, name, value):
+                raise AttributeError(name)
+
+        self.check_instances(Locked.from_columns(email=self.emails, phone=self.phones, gender=self.genders))
+
+    def test_inherited_fields(self):
+        class Employee(self.cls):
+            gender = None
+
+        people = Employee.from_columns(email=self.emails, phone=self.phones)
+        self.assertEqual([person.email for person in people], self.emails)
+
+        with self.assertRaises(ValueError):
+            Employee.from_columns(gender=self.genders)
+
+    def test_all_invalid_rows_reported(self):
+        emails = ["a@b.cd", "bad", None, "ok@ok.ok"]
+        phones = ["+71234567890", "+7 (123) 456-78-90", "+7 123 456 78 90", "12345"]
+        genders = ["Male", ["Male"], "Other", "Female"]
+
+        with self.assertRaises(ValidationError) as err:
+            self.cls.from_columns(email=emails, phone=phones, gender=genders)
+
+        self.assertTrue(isinstance(err.exception, ValueError))
+        self.assertEqual(err.exception.errors, [
+            (1, 'email', 'email_email_field must be a valid email address'),
+            (1, 'gender', "gender_gender_field must be 'Male' or 'Female'"),
+            (2, 'email', 'email_email_field must be a valid email address'),
+            (2, 'gender', "gender_gender_field must be 'Male' or 'Female'"),
+            (3, 'phone', 'phone_phone_number_field must be a valid russian phone number'),
+        ])
+        self.assertEqual(str(err.exception).splitlines()[0], 'row 1: email_email_field must be a valid email address')
+
+    def test_invalid_columns(self):
+        with self.assertRaises(ValueError):
+            self.cls.from_columns(email=self.emails, phone=self.phones[:2])
+
+        with self.assertRaises(ValueError):
+            self.cls.from_columns(name=['Ivan'])
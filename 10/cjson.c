@@ -3,9 +3,66 @@
 #include <stdlib.h>
 #include <stdbool.h>
 
+static const char* scan_number(const char* json)
+{
+    if (*json == '-')
+    {
+        json++;
+    }
+
+    if (*json == '0')
+    {
+        json++;
+    }
+    else if (*json >= '1' && *json <= '9')
+    {
+        while (*json >= '0' && *json <= '9')
+        {
+            json++;
+        }
+    }
+    else
+    {
+        return NULL;
+    }
+
+    if (*json == '.')
+    {
+        json++;
+        if (!(*json >= '0' && *json <= '9'))
+        {
+            return NULL;
+        }
+        while (*json >= '0' && *json <= '9')
+        {
+            json++;
+        }
+    }
+
+    if (*json == 'e' || *json == 'E')
+    {
+        json++;
+        if (*json == '+' || *json == '-')
+        {
+            json++;
+        }
+        if (!(*json >= '0' && *json <= '9'))
+        {
+            return NULL;
+        }
+        while (*json >= '0' && *json <= '9')
+        {
+            json++;
+        }
+    }
+
+    return json;
+}
+
 static PyObject* cjson_loads(PyObject* self, PyObject* args)
 {
     bool valid = false;
+    bool after_comma = false;
     const char* json;
     if (!PyArg_ParseTuple(args, "s", &json))
     {
@@ -39,6 +96,13 @@ static PyObject* cjson_loads(PyObject* self, PyObject* args)
     {
         if (*json == '}')
         {
+            if (after_comma)
+            {
+                PyErr_Format(PyExc_TypeError, "Expected object key after ','");
+                Py_DECREF(dict);
+                return NULL;
+            }
+
             json++;
             if (*json != '\0')
             {
@@ -70,7 +134,7 @@ static PyObject* cjson_loads(PyObject* self, PyObject* args)
         const char* key_start = json;
         while (*json != '\"')
         {
-            if (*json == '\0')
+            if ((unsigned char)*json < 0x20)
             {
                 PyErr_Format(PyExc_TypeError, "Expected closing '\"' for object key");
                 Py_DECREF(dict);
@@ -126,7 +190,7 @@ static PyObject* cjson_loads(PyObject* self, PyObject* args)
             const char* value_start = json;
             while (*json != '\"')
             {
-                if (*json == '\0')
+                if ((unsigned char)*json < 0x20)
                 {
                     PyErr_Format(PyExc_TypeError, "Expected closing '\"' for string value");
                     Py_DECREF(key);
@@ -150,9 +214,10 @@ static PyObject* cjson_loads(PyObject* self, PyObject* args)
         else
         {
             char* endptr;
-            double num = strtod(json, &endptr);
+            const char* number_end = scan_number(json);
+            double num = number_end ? strtod(json, &endptr) : 0;
 
-            if (endptr == json)
+            if (!number_end || endptr != number_end)
             {
                 PyErr_Format(PyExc_TypeError, "Expected number value");
                 Py_DECREF(key);
@@ -196,7 +261,8 @@ static PyObject* cjson_loads(PyObject* self, PyObject* args)
             return NULL;
         }
 
-        if (*json == ',')
+        after_comma = *json == ',';
+        if (after_comma)
         {
             json++;
         }